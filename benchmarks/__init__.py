@@ -0,0 +1 @@
+"""Benchmarks for mcp-generator and the servers it generates."""
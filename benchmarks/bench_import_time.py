@@ -0,0 +1,77 @@
+"""Benchmark CLI startup and the modules each subcommand imports.
+
+Runs ``python -X importtime -m mcp_generator <args>`` in fresh
+interpreters and reports, per command, the best wall time against an
+empty interpreter, the total import time, and the packages imported
+beyond interpreter startup, heaviest first.
+
+Usage::
+
+    python -m benchmarks.bench_import_time [--repeat 5] [--top 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+EXAMPLE = str(Path(__file__).resolve().parent.parent / "examples" / "basic-api.yaml")
+COMMANDS = {
+    "--help": ["--help"],
+    "validate": ["validate", EXAMPLE],
+    "preview": ["preview", EXAMPLE],
+}
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def run(args: List[str]) -> Tuple[float, str]:
+    """Run a fresh interpreter and return its wall time and import-time log."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+    )
+    return time.perf_counter() - start, proc.stderr
+
+
+def top_level_imports(log: str) -> Dict[str, float]:
+    """Return cumulative milliseconds per package of top-level imports in an importtime log."""
+    totals: Dict[str, float] = {}
+    for match in IMPORT_LINE.finditer(log):
+        if len(match.group(3)) == 1:
+            package = match.group(4).split(".")[0]
+            totals[package] = totals.get(package, 0.0) + int(match.group(2)) / 1000
+    return totals
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    empty, empty_log = min(run(["-c", "pass"]) for _ in range(args.repeat))
+    startup = set(top_level_imports(empty_log))
+    print(f"empty interpreter: {empty * 1000:.1f} ms\n")
+
+    for label, command in COMMANDS.items():
+        wall, log = min(run(["-m", "mcp_generator", *command]) for _ in range(args.repeat))
+        # Interpreter startup imports (site, .pth hooks) are the same for every command
+        imports = {
+            name: ms for name, ms in top_level_imports(log).items() if name not in startup
+        }
+        heaviest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[: args.top]
+        print(
+            f"{label:10s} wall {wall * 1000:6.1f} ms (+{(wall - empty) * 1000:.1f} ms), "
+            f"imports {sum(imports.values()):.1f} ms"
+        )
+        print("           heaviest: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in heaviest))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,134 @@
+"""Benchmark tools/list handling in generated servers.
+
+Compares the previous behaviour, where ``list_tools()`` rebuilt every
+``Tool`` object and input schema on each request, with the current one,
+where the list is built once at import. Both the bare handler and the
+full MCP request handler are timed, as well as module import for the
+inline and pre-serialized tool definitions.
+
+Usage::
+
+    python -m benchmarks.bench_list_tools [--sizes 10 100 1000]
+
+Requires the generated server's runtime dependencies (``mcp``, ``httpx``).
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, List, Optional
+
+from mcp_generator.generator import CodeGenerator
+from mcp_generator.parser import ConfigParser
+
+from .synthetic import make_config_dict
+
+
+def load_module(path: Path, name: str) -> ModuleType:
+    """Import a generated server module from a file."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_rebuild_function(source: str, module: ModuleType) -> Callable[[], Any]:
+    """
+    Recreate the previous per-request ``list_tools`` body.
+
+    The inline ``TOOLS`` literal from the generated source is wrapped in a
+    coroutine so each call constructs fresh ``Tool`` objects, exactly as
+    the old template did.
+    """
+    start = source.index("TOOLS: list[Tool] = [") + len("TOOLS: list[Tool] = ")
+    end = source.index("\n]\n", start) + 2
+    literal = source[start:end]
+    namespace = dict(vars(module))
+    exec("async def list_tools_uncached():\n    return " + literal.replace("\n", "\n    "), namespace)
+    return namespace["list_tools_uncached"]
+
+
+def time_per_call(func: Callable[[], Any], iterations: int) -> float:
+    """Return mean seconds per awaited call."""
+
+    async def run() -> float:
+        await func()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await func()
+        return (time.perf_counter() - start) / iterations
+
+    return asyncio.run(run())
+
+
+def sdk_handler(module: ModuleType, list_func: Callable[[], Any]) -> Callable[[], Any]:
+    """Register ``list_func`` on a fresh MCP server and return its request handler."""
+    from mcp.server import Server
+    from mcp.types import ListToolsRequest
+
+    server = Server("bench")
+    server.list_tools()(list_func)
+    handler = server.request_handlers[ListToolsRequest]
+    request = ListToolsRequest(method="tools/list")
+    return lambda: handler(request)
+
+
+def bench_size(num_tools: int, workdir: Path, iterations: int) -> List[str]:
+    """Run all measurements for one tool count."""
+    generator = CodeGenerator()
+    results = []
+    modules = {}
+    for preserialize in (False, True):
+        data = make_config_dict(num_tools)
+        data["server"]["preserialize_tools"] = preserialize
+        config = ConfigParser.parse_dict(data)
+        mode = "json" if preserialize else "inline"
+        path = workdir / f"server_{num_tools}_{mode}.py"
+        path.write_text(generator.preview(config), encoding="utf-8")
+
+        start = time.perf_counter()
+        modules[mode] = load_module(path, f"bench_server_{num_tools}_{mode}")
+        results.append(f"import ({mode}): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    module = modules["inline"]
+    rebuild = make_rebuild_function((workdir / f"server_{num_tools}_inline.py").read_text(), module)
+    timings = {
+        "list_tools rebuild": time_per_call(rebuild, iterations),
+        "list_tools cached": time_per_call(module.list_tools, iterations),
+        "handler rebuild": time_per_call(sdk_handler(module, rebuild), iterations),
+        "handler cached": time_per_call(sdk_handler(module, module.list_tools), iterations),
+    }
+    for label, seconds in timings.items():
+        results.append(f"{label}: {seconds * 1e6:.1f} us/call")
+    results.append(
+        f"speedup: list_tools {timings['list_tools rebuild'] / timings['list_tools cached']:.0f}x, "
+        f"handler {timings['handler rebuild'] / timings['handler cached']:.1f}x"
+    )
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    # Import the server runtime up front so module timings only cover generated code
+    import httpx  # noqa: F401
+    import mcp.server.stdio  # noqa: F401
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            print(f"\n{size} tools")
+            for line in bench_size(size, Path(tmp), args.iterations):
+                print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,110 @@
+"""Benchmark importing large OpenAPI documents.
+
+Times loading a synthetic OpenAPI 3 document and converting it into a
+generator configuration with ``OpenAPIImporter``, and compares the
+conversion with the common approach of first inlining every ``$ref`` into
+a deep copy of the document. Peak memory is measured with tracemalloc.
+
+Usage::
+
+    python -m benchmarks.bench_openapi_import [--operations 1000 10000] [--format json]
+        [--output-format json] [--inline-baseline]
+
+The inlining baseline grows with the length of reference chains and takes
+tens of seconds at 1000 operations, so it only runs when requested.
+"""
+
+import argparse
+import copy
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mcp_generator.parser.openapi_importer import OpenAPIImporter
+
+from .synthetic import make_openapi_dict, write_config
+
+
+def inline_refs(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a deep copy of the document with every local ``$ref`` inlined."""
+
+    def resolve(node: Any, stack: Tuple[str, ...]) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                if ref in stack:
+                    return {"type": "object"}
+                target = document
+                for token in ref[2:].split("/"):
+                    target = target[token]
+                return resolve(copy.deepcopy(target), stack + (ref,))
+            return {key: resolve(value, stack) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item, stack) for item in node]
+        return node
+
+    return resolve(document, ())
+
+
+def measure(func: Callable[[], Any]) -> Tuple[Any, float, float]:
+    """
+    Return the result, seconds and peak MB of a call.
+
+    The call is timed on its own and then repeated under tracemalloc,
+    which slows allocation-heavy code down several times.
+    """
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def bench_size(num_operations: int, args: argparse.Namespace, workdir: Path) -> List[str]:
+    """Run all measurements for one document size."""
+    spec = write_config(
+        make_openapi_dict(num_operations), workdir / f"spec_{num_operations}.{args.format}"
+    )
+    output = workdir / f"config_{num_operations}.{args.output_format}"
+    results = [f"spec size: {spec.stat().st_size / 1e6:.1f} MB"]
+
+    document, seconds, peak = measure(lambda: OpenAPIImporter.load(spec))
+    results.append(f"load: {seconds:.2f} s, peak {peak:.0f} MB")
+
+    count, seconds, peak = measure(lambda: OpenAPIImporter(document).write(output))
+    results.append(
+        f"convert + write {count} tools ({args.output_format}): {seconds:.2f} s, "
+        f"peak {peak:.0f} MB"
+    )
+
+    if args.inline_baseline:
+        # Cost of the inlining approach, before any conversion work
+        _, seconds, peak = measure(lambda: inline_refs(document))
+        results.append(f"inline all $refs first: {seconds:.2f} s, peak {peak:.0f} MB")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--format", choices=["json", "yaml"], default="json")
+    parser.add_argument("--output-format", choices=["json", "yaml"], default="json")
+    parser.add_argument("--inline-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.operations:
+            print(f"\n{size} operations ({args.format})")
+            for line in bench_size(size, args, Path(tmp)):
+                print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
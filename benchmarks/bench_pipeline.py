@@ -0,0 +1,177 @@
+"""Benchmark the generator pipeline on large synthetic configurations.
+
+Times ``ConfigParser.parse_file``, ``ConfigValidator.validate`` and
+``CodeGenerator.generate`` separately for YAML and JSON configs of
+increasing size, and records each stage's peak Python memory with
+``tracemalloc`` in a separate, untimed run.
+
+Results can be saved as a baseline and later compared against it; a
+stage that got slower or bigger than the baseline by more than the
+tolerance factor is reported as a regression and the run exits with
+status 1. A baseline recorded with different sizes or repeats is not
+compared. Baselines are machine specific, so refresh the checked-in
+file when the reference machine changes.
+
+Usage::
+
+    python -m benchmarks.bench_pipeline [--tools 100 1000] [--params 8] [--depth 2]
+    python -m benchmarks.bench_pipeline --update-baseline
+    python -m benchmarks.bench_pipeline --check [--tolerance 1.5] [--min-seconds 0.01]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from mcp_generator.generator import CodeGenerator
+from mcp_generator.parser import ConfigParser
+from mcp_generator.validator import ConfigValidator
+
+from .synthetic import make_config_dict, write_config
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+FORMATS = ("yaml", "json")
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Return the best wall time of ``repeat`` runs and the peak traced memory of one more."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(best, 5), "peak_mib": round(peak / (1024 * 1024), 3)}
+
+
+def bench_pipeline(
+    num_tools: int, num_params: int, depth: int, repeat: int, workdir: Path
+) -> Dict[str, Dict[str, float]]:
+    """Measure every stage for one config size in every format."""
+    data = make_config_dict(num_tools, num_params, depth)
+    # Built once so template setup is not timed, like the CLI's warm generator
+    generator = CodeGenerator()
+    results = {}
+    for fmt in FORMATS:
+        path = write_config(data, workdir / f"config_{num_tools}.{fmt}")
+        config = ConfigParser.parse_file(path)
+        output_dir = workdir / f"out_{num_tools}_{fmt}"
+        stages = {
+            "parse": lambda: ConfigParser.parse_file(path),
+            "validate": lambda: ConfigValidator.validate(config),
+            # force=True so every repeat renders instead of hitting the manifest no-op
+            "generate": lambda: generator.generate(config, output_dir, force=True),
+        }
+        for stage, func in stages.items():
+            results[f"{fmt}/{num_tools}/{stage}"] = measure(func, repeat)
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+    min_seconds: float = 0.01,
+) -> List[str]:
+    """
+    Return a message for every measurement that regressed beyond the tolerance.
+
+    Stages whose baseline time is below ``min_seconds`` are too noisy for a
+    ratio check, so only their memory is compared.
+    """
+    regressions = []
+    for key, expected in baseline.items():
+        actual = results.get(key)
+        if actual is None:
+            continue
+        for metric in ("seconds", "peak_mib"):
+            if metric == "seconds" and expected[metric] < min_seconds:
+                continue
+            if expected[metric] > 0 and actual[metric] > expected[metric] * tolerance:
+                regressions.append(
+                    f"{key} {metric}: {actual[metric]} vs baseline {expected[metric]} "
+                    f"({actual[metric] / expected[metric]:.2f}x)"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tools", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--params", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--min-seconds", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    # Silence per-file generation logging so it does not skew timings
+    import logging
+
+    logging.getLogger("mcp_generator").setLevel(logging.WARNING)
+
+    params = {
+        "tools": args.tools,
+        "params": args.params,
+        "depth": args.depth,
+        "repeat": args.repeat,
+    }
+    if args.check and not args.update_baseline:
+        # Timings from different sizes or repeat counts are not comparable
+        recorded = json.loads(args.baseline.read_text(encoding="utf-8")).get("params")
+        if recorded != params:
+            parser.error(
+                f"{args.baseline} was recorded with {recorded}, not {params}; "
+                f"rerun with matching options or --update-baseline"
+            )
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_tools in args.tools:
+            results.update(
+                bench_pipeline(num_tools, args.params, args.depth, args.repeat, Path(tmp))
+            )
+
+    print(f"{'stage':28s} {'seconds':>10s} {'peak MiB':>10s}")
+    for key, measurement in results.items():
+        print(f"{key:28s} {measurement['seconds']:10.4f} {measurement['peak_mib']:10.2f}")
+
+    if args.update_baseline:
+        baseline = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": params,
+            "results": results,
+        }
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.check:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline["results"], args.tolerance, args.min_seconds)
+        if regressions:
+            print(f"\n{len(regressions)} regressions beyond {args.tolerance}x:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance}x of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
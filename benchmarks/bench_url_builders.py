@@ -0,0 +1,115 @@
+"""Benchmark per-call URL and header construction in generated clients.
+
+Compares the previous per-call work, ``str.format`` plus ``urljoin`` for the
+URL and rebuilding the auth/content-type header dict, with the precompiled
+URL expressions emitted per tool and the static headers built once per
+client.
+
+Usage::
+
+    python -m benchmarks.bench_url_builders [--iterations 200000]
+
+Requires the generated server's runtime dependencies (``mcp``, ``httpx``).
+"""
+
+import argparse
+import importlib.util
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+from mcp_generator.generator import CodeGenerator
+from mcp_generator.parser import ConfigParser
+
+ENDPOINT = "/repos/{owner}/{repo}/issues/{number}"
+ARGUMENTS = {"owner": "octocat", "repo": "hello-world", "number": 42}
+
+
+def legacy_build_url(base_url: str, endpoint: str, path_params: Dict[str, Any]) -> str:
+    """URL construction as previously done by MCPHTTPClient._build_url."""
+    url = endpoint
+    if path_params:
+        url = url.format(**path_params)
+    return urljoin(base_url, url.lstrip("/"))
+
+
+def legacy_build_headers(
+    auth_token: str, additional_headers: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """Header construction as previously done by MCPHTTPClient._build_headers."""
+    headers = {"Content-Type": "application/json"}
+    if auth_token:
+        headers["Authorization"] = f"Bearer {auth_token}"
+    if additional_headers:
+        headers.update(additional_headers)
+    return headers
+
+
+def load_server(workdir: Path):
+    """Generate and import a server exposing the benchmark endpoint."""
+    config = ConfigParser.parse_dict(
+        {
+            "server": {
+                "name": "bench-api",
+                "description": "URL builder benchmark",
+                "base_url": "https://api.example.com/v3/",
+                "authentication": {"type": "bearer"},
+            },
+            "tools": [
+                {
+                    "name": "get_issue",
+                    "description": "Get an issue",
+                    "endpoint": ENDPOINT,
+                    "method": "GET",
+                    "parameters": [
+                        {"name": name, "type": "string", "location": "path", "required": True}
+                        for name in ARGUMENTS
+                    ],
+                }
+            ],
+        }
+    )
+    path = workdir / "server.py"
+    path.write_text(CodeGenerator().preview(config), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("bench_url_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = load_server(Path(tmp))
+
+    client = server.MCPHTTPClient(server.BASE_URL, server.TIMEOUT, "token")
+    url_expression = CodeGenerator.url_expression(ENDPOINT)
+    namespace = {
+        "BASE_PREFIX": server.BASE_PREFIX,
+        "quote_path": server.quote_path,
+        "arguments": ARGUMENTS,
+    }
+    precompiled_url = eval(f"lambda: {url_expression}", namespace)
+    assert precompiled_url() == legacy_build_url(server.BASE_URL, ENDPOINT, ARGUMENTS)
+
+    cases = {
+        "url: format + urljoin": lambda: legacy_build_url(server.BASE_URL, ENDPOINT, ARGUMENTS),
+        "url: precompiled": precompiled_url,
+        "headers: rebuilt": lambda: legacy_build_headers("token"),
+        "headers: static": lambda: client._build_headers(None),
+        "headers: static + extra": lambda: client._build_headers({"X-Trace": "1"}),
+    }
+    for label, func in cases.items():
+        seconds = timeit.timeit(func, number=args.iterations) / args.iterations
+        print(f"{label:28s} {seconds * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,198 @@
+"""Synthetic configurations for benchmarks."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+_LOCATIONS = ["query", "query", "header", "body"]
+_TYPES = ["string", "integer", "number", "boolean"]
+
+
+def make_object_param(name: str, depth: int, width: int = 3) -> Dict[str, Any]:
+    """
+    Build an object parameter nested ``depth`` levels deep.
+
+    Args:
+        name: Parameter name
+        depth: Levels of nested objects below this one
+        width: Scalar properties per level
+
+    Returns:
+        Object parameter definition
+    """
+    properties: Dict[str, Any] = {
+        f"field_{k}": {"name": f"field_{k}", "type": _TYPES[k % len(_TYPES)], "location": "body"}
+        for k in range(width)
+    }
+    if depth > 0:
+        properties["child"] = make_object_param("child", depth - 1, width)
+    return {
+        "name": name,
+        "type": "object",
+        "location": "body",
+        "description": f"Nested object ({depth} levels below)",
+        "properties": properties,
+    }
+
+
+def make_config_dict(num_tools: int, num_params: int = 4, depth: int = 0) -> Dict[str, Any]:
+    """
+    Build a configuration dictionary with many tools.
+
+    Every tool has one path parameter followed by ``num_params - 1``
+    parameters spread over the remaining locations. With ``depth`` above
+    zero, every tool also gets a body object nested that many levels.
+
+    Args:
+        num_tools: Number of tools to generate
+        num_params: Number of parameters per tool
+        depth: Nesting depth of an extra object parameter (0 for none)
+
+    Returns:
+        Configuration data accepted by ``ConfigParser.parse_dict``
+    """
+    tools: List[Dict[str, Any]] = []
+    for i in range(num_tools):
+        parameters = [
+            {
+                "name": "item_id",
+                "type": "string",
+                "location": "path",
+                "description": "Item identifier",
+                "required": True,
+            }
+        ]
+        for j in range(1, num_params):
+            parameters.append(
+                {
+                    "name": f"param_{j}",
+                    "type": _TYPES[j % len(_TYPES)],
+                    "location": _LOCATIONS[j % len(_LOCATIONS)],
+                    "description": f"Parameter {j} of tool {i}",
+                    "required": j % 3 == 0,
+                }
+            )
+        if depth > 0:
+            parameters.append(make_object_param("payload", depth - 1))
+        tools.append(
+            {
+                "name": f"tool_{i}",
+                "description": f"Synthetic tool number {i}",
+                "endpoint": f"/resources_{i % 50}/{{item_id}}",
+                "method": "GET" if i % 4 else "POST",
+                "parameters": parameters,
+            }
+        )
+
+    return {
+        "server": {
+            "name": "synthetic-api",
+            "version": "1.0.0",
+            "description": "Synthetic API for benchmarks",
+            "base_url": "https://api.example.com",
+        },
+        "tools": tools,
+    }
+
+
+def write_config(data: Dict[str, Any], path: Path) -> Path:
+    """
+    Write configuration data as YAML or JSON depending on the file suffix.
+
+    Args:
+        data: Configuration data
+        path: Destination ending in .yaml, .yml or .json
+
+    Returns:
+        The written path
+    """
+    if path.suffix == ".json":
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    else:
+        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def make_openapi_dict(num_operations: int, num_schemas: int = 50, width: int = 8) -> Dict[str, Any]:
+    """
+    Build an OpenAPI 3 document with many operations sharing components.
+
+    Every operation references a shared query parameter and, for writes,
+    a request body schema; schemas reference each other, including a
+    cycle, the way large generated specs do.
+
+    Args:
+        num_operations: Number of operations to generate
+        num_schemas: Number of component schemas shared by the operations
+        width: Scalar properties per schema
+
+    Returns:
+        OpenAPI document accepted by ``OpenAPIImporter``
+    """
+    schemas: Dict[str, Any] = {}
+    for s in range(num_schemas):
+        properties: Dict[str, Any] = {
+            f"field_{k}": {
+                "type": _TYPES[k % len(_TYPES)],
+                "description": f"Field {k} of model {s}",
+            }
+            for k in range(width)
+        }
+        properties["related"] = {"$ref": f"#/components/schemas/Model{(s + 1) % num_schemas}"}
+        schemas[f"Model{s}"] = {"type": "object", "required": ["field_0"], "properties": properties}
+
+    paths: Dict[str, Any] = {}
+    for i in range(num_operations):
+        operation: Dict[str, Any] = {
+            "operationId": f"operation{i}",
+            "tags": [f"group_{i % 20}"],
+            "summary": f"Synthetic operation number {i}",
+            "description": f"Longer description of synthetic operation {i}. " * 5,
+            "parameters": [{"$ref": "#/components/parameters/Limit"}],
+            "responses": {
+                "200": {
+                    "description": "Success",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": f"#/components/schemas/Model{i % num_schemas}"}
+                        }
+                    },
+                }
+            },
+        }
+        method = "get" if i % 4 else "post"
+        if method == "post":
+            operation["requestBody"] = {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": f"#/components/schemas/Model{i % num_schemas}"}
+                    }
+                },
+            }
+        paths[f"/resources_{i}/{{item_id}}"] = {
+            "parameters": [
+                {"name": "item_id", "in": "path", "required": True, "schema": {"type": "string"}}
+            ],
+            method: operation,
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": paths,
+        "components": {
+            "parameters": {
+                "Limit": {
+                    "name": "limit",
+                    "in": "query",
+                    "description": "Maximum items returned",
+                    "schema": {"type": "integer", "default": 20},
+                }
+            },
+            "schemas": schemas,
+        },
+    }
@@ -0,0 +1,35 @@
+"""Lazy package exports (PEP 562)."""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Each exported name is imported from its submodule on first access and
+    then stored on the package, so importing the package stays cheap.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Public name -> relative submodule defining it
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to assign in the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
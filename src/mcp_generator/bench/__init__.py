@@ -0,0 +1,19 @@
+"""Benchmark module."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .mock_backend import MockBackend
+    from .runner import BenchmarkRunner
+
+# Public name -> submodule defining it; imported on first access (PEP 562)
+_EXPORTS = {
+    "BenchmarkRunner": ".runner",
+    "MockBackend": ".mock_backend",
+}
+
+__all__ = ["BenchmarkRunner", "MockBackend"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
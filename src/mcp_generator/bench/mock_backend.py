@@ -0,0 +1,135 @@
+"""Mock HTTP backend serving synthetic responses for a configuration."""
+
+import asyncio
+import json
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from ..models import MCPConfig, Tool
+
+
+class MockBackend:
+    """Local HTTP/1.1 server answering every tool endpoint with synthetic JSON."""
+
+    def __init__(self, config: MCPConfig, latency: float = 0.0, response_size: int = 1024):
+        """
+        Initialize mock backend.
+
+        Args:
+            config: Configuration whose tool endpoints are served
+            latency: Seconds to wait before answering each request
+            response_size: Approximate size of each JSON response in bytes
+        """
+        self.latency = latency
+        self.response_size = response_size
+        self.routes: List[Tuple[str, Pattern[str], Tool]] = [
+            (tool.method.value, self.compile_endpoint(tool.endpoint), tool)
+            for tool in config.tools
+        ]
+        self.requests = 0
+        self._payloads: Dict[str, bytes] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @staticmethod
+    def compile_endpoint(endpoint: str) -> Pattern[str]:
+        """
+        Compile an endpoint template into a path regex.
+
+        Args:
+            endpoint: Endpoint path with {param} placeholders
+
+        Returns:
+            Pattern matching request paths for the endpoint
+        """
+        parts = re.split(r"\{[^}]+\}", "/" + endpoint.lstrip("/"))
+        return re.compile("^" + "[^/]+".join(re.escape(part) for part in parts) + "$")
+
+    def payload(self, tool: Tool) -> bytes:
+        """
+        Build the synthetic JSON response of a tool.
+
+        Args:
+            tool: Tool being answered
+
+        Returns:
+            JSON array of records totalling about response_size bytes
+        """
+        payload = self._payloads.get(tool.name)
+        if payload is None:
+            records = []
+            size = 2
+            while size < self.response_size:
+                record = {"id": len(records), "name": f"{tool.name}-{len(records)}", "value": "x" * 32}
+                size += len(json.dumps(record)) + 2
+                records.append(record)
+            payload = self._payloads[tool.name] = json.dumps(records).encode()
+        return payload
+
+    def match(self, method: str, path: str) -> Optional[Tool]:
+        """Return the tool serving a request, if any."""
+        for route_method, pattern, tool in self.routes:
+            if route_method == method and pattern.match(path):
+                return tool
+        return None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start serving.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+
+        Returns:
+            Base URL of the backend
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{port}/"
+
+    async def close(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer requests on a keep-alive connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                tool = self.match(method, target.split("?", 1)[0])
+                if tool is None:
+                    status, body = "404 Not Found", b'{"error": "not found"}'
+                else:
+                    status, body = "200 OK", self.payload(tool)
+                writer.write(
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
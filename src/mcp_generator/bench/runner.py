@@ -0,0 +1,191 @@
+"""Benchmark driver for generated servers."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from ..generator import get_generator
+from ..models import MCPConfig, ParameterType, Tool
+from ..tracing import TraceReport
+from .mock_backend import MockBackend
+
+# Argument values sent for parameters without a default
+SAMPLE_VALUES: Dict[ParameterType, Any] = {
+    ParameterType.STRING: "sample",
+    ParameterType.INTEGER: 1,
+    ParameterType.NUMBER: 1.0,
+    ParameterType.BOOLEAN: True,
+    ParameterType.ARRAY: [],
+    ParameterType.OBJECT: {},
+}
+
+
+class BenchmarkRunner:
+    """Drives a generated server over stdio against a mock backend."""
+
+    def __init__(
+        self,
+        config: MCPConfig,
+        requests: int = 1000,
+        concurrency: int = 10,
+        latency: float = 0.0,
+        response_size: int = 1024,
+        tools: Optional[Sequence[str]] = None,
+        warmup: int = 10,
+    ):
+        """
+        Initialize benchmark runner.
+
+        Args:
+            config: Configuration of the server under test
+            requests: Number of measured tool calls
+            concurrency: Number of tool calls kept in flight
+            latency: Seconds the mock backend waits before answering
+            response_size: Approximate mock response size in bytes
+            tools: Names of the tools to call (defaults to all tools)
+            warmup: Unmeasured tool calls made before measuring
+
+        Raises:
+            ValueError: If a tool name is unknown or a count is not positive
+        """
+        if requests < 1 or concurrency < 1:
+            raise ValueError("requests and concurrency must be at least 1")
+        unknown = set(tools or []) - {tool.name for tool in config.tools}
+        if unknown:
+            raise ValueError(f"Unknown tools: {', '.join(sorted(unknown))}")
+
+        self.config = config
+        self.requests = requests
+        self.concurrency = concurrency
+        self.latency = latency
+        self.response_size = response_size
+        self.tools = [tool for tool in config.tools if not tools or tool.name in tools]
+        self.warmup = warmup
+
+    @staticmethod
+    def sample_arguments(tool: Tool) -> Dict[str, Any]:
+        """
+        Build arguments for a tool call from its parameter definitions.
+
+        Args:
+            tool: Tool to call
+
+        Returns:
+            Values for every required parameter
+        """
+        return {
+            param.name: param.default if param.default is not None else SAMPLE_VALUES[param.type]
+            for param in tool.parameters
+            if param.required
+        }
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark.
+
+        Returns:
+            Throughput, latency percentiles in ms and server peak memory
+
+        Raises:
+            RuntimeError: If the MCP client library is not installed
+        """
+        return asyncio.run(self._run())
+
+    async def _run(self) -> Dict[str, Any]:
+        """Start the backend and server, then drive the server."""
+        try:
+            from mcp import ClientSession
+            from mcp.client.stdio import StdioServerParameters, stdio_client
+        except ImportError as e:
+            raise RuntimeError("mcp-gen bench requires the 'mcp' package: pip install mcp") from e
+
+        backend = MockBackend(self.config, self.latency, self.response_size)
+        base_url = await backend.start()
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                data = self.config.model_dump()
+                data["server"]["base_url"] = base_url
+                get_generator().generate(MCPConfig.model_validate(data), Path(tmp))
+
+                params = StdioServerParameters(
+                    command=sys.executable,
+                    args=[str(Path(tmp) / "server.py")],
+                    env={**os.environ, "API_AUTH_TOKEN": os.environ.get("API_AUTH_TOKEN", "bench")},
+                    cwd=tmp,
+                )
+                # Keep per-request server logging out of the terminal and off the hot path
+                with open(os.devnull, "w") as errlog:
+                    async with stdio_client(params, errlog=errlog) as (read, write):
+                        async with ClientSession(read, write) as session:
+                            await session.initialize()
+                            result = await self._drive(session)
+        finally:
+            await backend.close()
+
+        result["backend_requests"] = backend.requests
+        result["server_peak_rss_mb"] = self.child_peak_rss()
+        return result
+
+    async def _drive(self, session: Any) -> Dict[str, Any]:
+        """Issue warmup and measured tool calls with the configured concurrency."""
+        calls = [(tool.name, self.sample_arguments(tool)) for tool in self.tools]
+        for n in range(self.warmup):
+            await session.call_tool(*calls[n % len(calls)])
+
+        latencies: List[float] = []
+        errors = 0
+        issued = 0
+
+        async def worker() -> None:
+            nonlocal errors, issued
+            while issued < self.requests:
+                name, arguments = calls[issued % len(calls)]
+                issued += 1
+                started = time.perf_counter()
+                result = await session.call_tool(name, arguments)
+                latencies.append(time.perf_counter() - started)
+                if result.isError or any(
+                    getattr(item, "text", "").startswith("Error:") for item in result.content
+                ):
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        result: Dict[str, Any] = {
+            "requests": len(latencies),
+            "errors": errors,
+            "concurrency": self.concurrency,
+            "elapsed_s": elapsed,
+            "throughput_rps": len(latencies) / elapsed,
+            "mean_ms": sum(latencies) / len(latencies) * 1000,
+            "max_ms": latencies[-1] * 1000,
+        }
+        for pct in (50, 95, 99):
+            result[f"p{pct}_ms"] = TraceReport.percentile(latencies, pct) * 1000
+        return result
+
+    @staticmethod
+    def child_peak_rss() -> Optional[float]:
+        """
+        Return the peak resident memory of finished child processes.
+
+        Returns:
+            Peak RSS in MiB, or None where the platform does not report it
+        """
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KiB elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
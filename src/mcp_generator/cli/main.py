@@ -1,39 +1,58 @@
-"""Command-line interface for MCP Generator."""
+"""
+Command-line interface for MCP Generator.
+
+Only click is imported up front. rich, pydantic, yaml, jinja2 and the
+generator packages are imported inside the commands that use them, so
+``mcp-gen --help`` and ``mcp-gen validate`` stay fast enough to run from
+pre-commit hooks.
+"""
 
 import logging
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import click
-from pydantic import ValidationError
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.syntax import Syntax
-
-from ..generator import CodeGenerator
-from ..parser import ConfigParser
-from ..validator import ConfigValidator
-
-# Set up console and logging
-console = Console()
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)],
-)
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_console():
+    """Create the shared rich console and route logging through it."""
+    from rich.console import Console
+    from rich.logging import RichHandler
+
+    console = Console()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+    )
+    return console
+
+
+class _LazyConsole:
+    """Stands in for the rich console until a command first uses it."""
+
+    def __getattr__(self, name):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="mcp-generator")
 def cli():
     """MCP Generator - Generate MCP server code for HTTP backends."""
-    pass
+    # Configure logging before any subcommand runs; --help exits before this
+    get_console()
 
 
 @cli.command()
-@click.argument("config_file", type=click.Path(exists=True))
+@click.argument("config_files", nargs=-1, required=True)
 @click.option(
     "-o",
     "--output",
@@ -46,8 +65,44 @@ def cli():
     is_flag=True,
     help="Only validate configuration without generating code",
 )
-def generate(config_file: str, output: str, validate_only: bool):
-    """Generate MCP server code from configuration file."""
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for multiple configs (default: CPU count)",
+)
+@click.option(
+    "--layout",
+    type=click.Choice(["single", "package", "data"]),
+    default="single",
+    help=(
+        "Emit one server.py, a package with one lazily imported module per tool group, "
+        "or a generic server driven by a tools.json table"
+    ),
+)
+def generate(config_files: tuple, output: str, validate_only: bool, jobs: int, layout: str):
+    """
+    Generate MCP server code from configuration files.
+
+    CONFIG_FILES may be files, glob patterns or directories. A single file
+    is generated into OUTPUT; several configs are generated in parallel,
+    each into OUTPUT/<config file stem>.
+    """
+    if len(config_files) == 1 and Path(config_files[0]).is_file():
+        _generate_single(config_files[0], output, validate_only, layout)
+    else:
+        _generate_batch(config_files, output, validate_only, jobs, layout)
+
+
+def _generate_single(config_file: str, output: str, validate_only: bool, layout: str):
+    """Generate one config with step-by-step output."""
+    from pydantic import ValidationError
+    from rich.panel import Panel
+
+    from ..parser import ConfigParser
+    from ..validator import ConfigValidator
+
     try:
         console.print(f"\n[bold blue]Reading configuration from {config_file}...[/bold blue]")
 
@@ -84,8 +139,10 @@ def generate(config_file: str, output: str, validate_only: bool):
 
         # Generate code
         console.print(f"\n[bold blue]Generating code in {output}...[/bold blue]")
-        generator = CodeGenerator()
-        generator.generate(config, Path(output))
+        from ..generator import get_generator
+
+        generator = get_generator()
+        generator.generate(config, Path(output), layout=layout)
 
         console.print(
             Panel(
@@ -104,7 +161,7 @@ def generate(config_file: str, output: str, validate_only: bool):
         console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
         sys.exit(1)
     except ValidationError as e:
-        console.print(f"\n[bold red]✗ Configuration validation error:[/bold red]")
+        console.print("\n[bold red]✗ Configuration validation error:[/bold red]")
         console.print(e)
         sys.exit(1)
     except Exception as e:
@@ -113,12 +170,59 @@ def generate(config_file: str, output: str, validate_only: bool):
         sys.exit(1)
 
 
+def _generate_batch(patterns: tuple, output: str, validate_only: bool, jobs: int, layout: str):
+    """Generate many configs across a process pool and print a combined summary."""
+    from rich.table import Table
+
+    from ..generator import BatchGenerator
+
+    try:
+        config_files = BatchGenerator.resolve_inputs(patterns)
+        batch = BatchGenerator(config_files, Path(output), jobs=jobs)
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        sys.exit(1)
+
+    action = "Validating" if validate_only else "Generating"
+    console.print(
+        f"\n[bold blue]{action} {len(config_files)} configurations "
+        f"with {batch.jobs} worker{'s' if batch.jobs > 1 else ''}...[/bold blue]"
+    )
+    # The summary table replaces per-file generation logging
+    logging.getLogger("mcp_generator").setLevel(logging.WARNING)
+    start = time.perf_counter()
+    results = batch.run(validate_only=validate_only, layout=layout)
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if not result["ok"]]
+    table = Table(title=f"{len(results) - len(failed)} succeeded, {len(failed)} failed in {elapsed:.2f}s")
+    table.add_column("Config")
+    table.add_column("Tools", justify="right")
+    table.add_column("Output")
+    table.add_column("Status")
+    for result in results:
+        status = "[green]✓[/green]" if result["ok"] else "[red]✗ " + "; ".join(result["errors"]) + "[/red]"
+        output_dir = "-" if validate_only or not result["ok"] else result["output"]
+        table.add_row(result["config"], str(result["tools"]), output_dir, status)
+    console.print(table)
+
+    if failed:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("config_file", type=click.Path(exists=True))
 def validate(config_file: str):
     """Validate configuration file without generating code."""
     ctx = click.get_current_context()
-    ctx.invoke(generate, config_file=config_file, output="./generated", validate_only=True)
+    ctx.invoke(
+        generate,
+        config_files=(config_file,),
+        output="./generated",
+        validate_only=True,
+        jobs=None,
+        layout="single",
+    )
 
 
 @cli.command()
@@ -131,6 +235,11 @@ def validate(config_file: str):
 )
 def preview(config_file: str, template: str):
     """Preview generated code without writing to disk."""
+    from rich.syntax import Syntax
+
+    from ..generator import get_generator
+    from ..parser import ConfigParser
+
     try:
         console.print(f"\n[bold blue]Reading configuration from {config_file}...[/bold blue]")
 
@@ -145,7 +254,7 @@ def preview(config_file: str, template: str):
         }
 
         # Generate preview
-        generator = CodeGenerator()
+        generator = get_generator()
         content = generator.preview(config, template_map[template])
 
         # Display preview
@@ -175,6 +284,8 @@ def preview(config_file: str, template: str):
 )
 def init(output: str):
     """Create a sample configuration file."""
+    from rich.panel import Panel
+
     sample_config = """server:
   name: "example-api"
   version: "1.0.0"
@@ -239,6 +350,226 @@ tools:
     )
 
 
+@cli.command("import-openapi")
+@click.argument("spec_file", type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(),
+    default="./config.json",
+    help="Configuration file to write (.json, .yaml or .yml)",
+)
+@click.option(
+    "--tag", "tags", multiple=True, help="Only import operations with this tag (repeatable)"
+)
+@click.option(
+    "--path", "paths", multiple=True, help="Only import paths matching this glob (repeatable)"
+)
+@click.option(
+    "--base-url", default=None, help="Target API URL (defaults to the spec's first server)"
+)
+@click.option("--name", default=None, help="Server name (defaults to the spec title)")
+def import_openapi(
+    spec_file: str, output: str, tags: tuple, paths: tuple, base_url: str, name: str
+):
+    """Convert an OpenAPI 3 document into a configuration file."""
+    from rich.panel import Panel
+
+    from ..parser import OpenAPIImporter
+
+    try:
+        console.print(f"\n[bold blue]Reading OpenAPI document from {spec_file}...[/bold blue]")
+        start = time.perf_counter()
+        importer = OpenAPIImporter.from_file(
+            spec_file, tags=tags, paths=paths, base_url=base_url, name=name
+        )
+        count = importer.write(output)
+        elapsed = time.perf_counter() - start
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        sys.exit(1)
+
+    for warning in importer.warnings[:10]:
+        console.print(f"  [yellow]•[/yellow] {warning}")
+    if len(importer.warnings) > 10:
+        console.print(f"  [yellow]... and {len(importer.warnings) - 10} more warnings[/yellow]")
+
+    if not count:
+        console.print("\n[bold red]✗ No operations could be imported.[/bold red]")
+        sys.exit(1)
+
+    console.print(
+        Panel(
+            f"[green]✓ Imported {count} tool{'s' if count > 1 else ''} "
+            f"in {elapsed:.2f}s![/green]\n\n"
+            f"[bold]File:[/bold] {Path(output).absolute()}\n\n"
+            f"[bold]Next steps:[/bold]\n"
+            f"1. Review {output}\n"
+            f"2. mcp-gen generate {output}",
+            title="Success",
+            border_style="green",
+        )
+    )
+
+
+@cli.command()
+@click.argument("config_file", type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(),
+    default="./generated",
+    help="Output directory for generated code",
+)
+@click.option("--interval", type=float, default=0.5, help="Seconds between checks for changes")
+@click.option(
+    "--debounce", type=float, default=0.2, help="Seconds files must be quiet before regenerating"
+)
+@click.option(
+    "--layout",
+    type=click.Choice(["single", "package", "data"]),
+    default="single",
+    help=(
+        "Emit one server.py, a package with one lazily imported module per tool group, "
+        "or a generic server driven by a tools.json table"
+    ),
+)
+def watch(config_file: str, output: str, interval: float, debounce: float, layout: str):
+    """Regenerate code whenever the configuration or templates change."""
+    from ..generator import ConfigWatcher
+
+    watcher = ConfigWatcher(
+        Path(config_file), Path(output), interval=interval, debounce=debounce, layout=layout
+    )
+    # Each rebuild prints one status line instead of per-file logging
+    logging.getLogger("mcp_generator").setLevel(logging.WARNING)
+
+    def report(result):
+        stamp = time.strftime("%H:%M:%S")
+        elapsed = f"{result['seconds'] * 1000:.0f} ms"
+        if not result["ok"]:
+            console.print(f"[dim]{stamp}[/dim] [red]✗ {config_file} is invalid ({elapsed}):[/red]")
+            for error in result["errors"]:
+                console.print(f"  [red]•[/red] {error}")
+        elif result["written"]:
+            names = ", ".join(Path(path).name for path in result["written"])
+            console.print(f"[dim]{stamp}[/dim] [green]✓[/green] Updated {names} ({elapsed})")
+        else:
+            console.print(f"[dim]{stamp}[/dim] [green]✓[/green] Up to date ({elapsed})")
+
+    console.print(
+        f"\n[bold blue]Watching {config_file} and {len(watcher.template_files)} templates, "
+        f"generating into {output}. Press Ctrl+C to stop.[/bold blue]"
+    )
+    try:
+        watcher.run(report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching.[/yellow]")
+
+
+@cli.command()
+@click.argument("config_file", type=click.Path(exists=True))
+@click.option("-n", "--requests", type=int, default=1000, help="Number of measured tool calls")
+@click.option("-c", "--concurrency", type=int, default=10, help="Tool calls kept in flight")
+@click.option("--latency", type=float, default=0.0, help="Mock backend latency in milliseconds")
+@click.option(
+    "--response-size", type=int, default=1024, help="Mock response size in bytes"
+)
+@click.option("--tool", "tools", multiple=True, help="Only call this tool (repeatable)")
+@click.option("--warmup", type=int, default=10, help="Unmeasured calls made first")
+def bench(
+    config_file: str,
+    requests: int,
+    concurrency: int,
+    latency: float,
+    response_size: int,
+    tools: tuple,
+    warmup: int,
+):
+    """Benchmark the generated server offline against a mock backend."""
+    from pydantic import ValidationError
+    from rich.table import Table
+
+    from ..bench import BenchmarkRunner
+    from ..parser import ConfigParser
+    from ..validator import ConfigValidator
+
+    try:
+        config = ConfigParser.parse_file(config_file)
+        errors = ConfigValidator.validate(config)
+        if errors:
+            console.print("\n[bold red]✗ Validation failed with the following errors:[/bold red]")
+            for error in errors:
+                console.print(f"  [red]•[/red] {error}")
+            sys.exit(1)
+
+        runner = BenchmarkRunner(
+            config,
+            requests=requests,
+            concurrency=concurrency,
+            latency=latency / 1000,
+            response_size=response_size,
+            tools=tools,
+            warmup=warmup,
+        )
+        console.print(
+            f"\n[bold blue]Benchmarking {config.server.name}: {requests} calls, "
+            f"concurrency {concurrency}...[/bold blue]"
+        )
+        result = runner.run()
+    except (ValueError, RuntimeError, ValidationError) as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        sys.exit(1)
+
+    table = Table(title="Benchmark Results")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Tool calls", f"{result['requests']} ({result['errors']} errors)")
+    table.add_row("Throughput", f"{result['throughput_rps']:.1f} calls/s")
+    for key in ("mean", "p50", "p95", "p99", "max"):
+        table.add_row(f"Latency {key}", f"{result[f'{key}_ms']:.2f} ms")
+    peak = result["server_peak_rss_mb"]
+    table.add_row("Server peak RSS", "n/a" if peak is None else f"{peak:.1f} MiB")
+    table.add_row("Backend requests", str(result["backend_requests"]))
+    console.print(table)
+
+
+@cli.command("trace-report")
+@click.argument("trace_file", type=click.Path(exists=True))
+@click.option("--tool", help="Only include traces of this tool")
+def trace_report(trace_file: str, tool: str):
+    """Summarize a generated server's trace file into per-phase percentiles."""
+    from rich.table import Table
+
+    from ..tracing import TraceReport
+
+    try:
+        summary = TraceReport.summarize(TraceReport.read(trace_file, tool))
+    except (OSError, ValueError, KeyError) as e:
+        console.print(f"\n[bold red]✗ Error:[/bold red] {e}")
+        sys.exit(1)
+
+    if not summary:
+        console.print("[yellow]No traces found.[/yellow]")
+        return
+
+    total = summary.pop("total")
+    table = Table(title=f"{total['count']} traces, {total['errors']} errors (ms)")
+    table.add_column("Phase")
+    for column in ["calls", "mean"] + [f"p{pct}" for pct in TraceReport.PERCENTILES] + ["max"]:
+        table.add_column(column, justify="right")
+
+    phases = sorted(summary.items(), key=lambda item: item[1]["mean"], reverse=True)
+    for name, stats in [("total", total)] + phases:
+        table.add_row(
+            name,
+            str(stats["count"]),
+            *(f"{stats[key]:.2f}" for key in ["mean"] + [f"p{p}" for p in TraceReport.PERCENTILES]),
+            f"{stats['max']:.2f}",
+        )
+    console.print(table)
+
+
 def main():
     """Main entry point."""
     cli()
@@ -1,5 +1,23 @@
 """Code generation module."""
 
-from .code_generator import CodeGenerator
+from typing import TYPE_CHECKING
 
-__all__ = ["CodeGenerator"]
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .batch import BatchGenerator
+    from .code_generator import CodeGenerator, get_generator
+    from .watcher import ConfigWatcher
+
+# Public name -> submodule defining it; imported on first access (PEP 562)
+# so importing the package does not load jinja2, pydantic or yaml
+_EXPORTS = {
+    "BatchGenerator": ".batch",
+    "CodeGenerator": ".code_generator",
+    "ConfigWatcher": ".watcher",
+    "get_generator": ".code_generator",
+}
+
+__all__ = ["BatchGenerator", "CodeGenerator", "ConfigWatcher", "get_generator"]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
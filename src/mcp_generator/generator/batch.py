@@ -0,0 +1,194 @@
+"""Parallel code generation for many configuration files."""
+
+import glob
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import ValidationError
+
+from ..parser import ConfigParser
+from ..validator import ConfigValidator
+from .code_generator import CodeGenerator, get_generator
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker() -> None:
+    """Build the worker's shared generator once and quiet per-file logging."""
+    get_generator()
+    logging.getLogger("mcp_generator").setLevel(logging.WARNING)
+
+
+def _process(config_file: str, output_dir: str, validate_only: bool, layout: str) -> Dict[str, Any]:
+    """Parse, validate and generate one config in a worker process."""
+    return BatchGenerator.process(
+        get_generator(), Path(config_file), Path(output_dir), validate_only, layout
+    )
+
+
+class BatchGenerator:
+    """Generates MCP servers for many configuration files across a process pool."""
+
+    CONFIG_SUFFIXES = (".yaml", ".yml", ".json")
+
+    def __init__(self, config_files: List[Path], output_root: Path, jobs: Optional[int] = None):
+        """
+        Initialize batch generator.
+
+        Args:
+            config_files: Configuration files to generate
+            output_root: Directory receiving one sub-directory per config
+            jobs: Worker processes; defaults to the CPU count
+
+        Raises:
+            ValueError: If two configs would share an output directory
+        """
+        self.config_files = config_files
+        self.output_dirs = self.output_dirs_for(config_files, output_root)
+        self.jobs = max(1, min(jobs or os.cpu_count() or 1, len(config_files) or 1))
+
+    @classmethod
+    def resolve_inputs(cls, patterns: Iterable[str]) -> List[Path]:
+        """
+        Expand files, glob patterns and directories into config files.
+
+        Directories contribute their ``.yaml``, ``.yml`` and ``.json`` files
+        (not recursively); glob patterns support ``**``. Duplicates are
+        dropped while keeping the first occurrence's order.
+
+        Args:
+            patterns: Paths, directories or glob patterns
+
+        Returns:
+            Configuration file paths
+
+        Raises:
+            FileNotFoundError: If a pattern matches nothing
+        """
+        files: Dict[Path, None] = {}
+        for pattern in patterns:
+            path = Path(pattern)
+            if path.is_dir():
+                matches = sorted(
+                    child for child in path.iterdir()
+                    if child.is_file() and child.suffix.lower() in cls.CONFIG_SUFFIXES
+                )
+            elif path.is_file():
+                matches = [path]
+            elif glob.has_magic(pattern):
+                matches = sorted(Path(match) for match in glob.glob(pattern, recursive=True))
+                matches = [match for match in matches if match.is_file()]
+            else:
+                matches = []
+            if not matches:
+                raise FileNotFoundError(f"No configuration files match: {pattern}")
+            files.update(dict.fromkeys(matches))
+        return list(files)
+
+    @staticmethod
+    def output_dirs_for(config_files: List[Path], output_root: Path) -> Dict[Path, Path]:
+        """
+        Map each config to ``output_root/<config stem>``.
+
+        Raises:
+            ValueError: If two configs have the same file stem
+        """
+        output_dirs: Dict[Path, Path] = {}
+        seen: Dict[str, Path] = {}
+        for config_file in config_files:
+            stem = config_file.stem
+            if stem in seen:
+                raise ValueError(
+                    f"{config_file} and {seen[stem]} would both be generated into "
+                    f"{output_root / stem}"
+                )
+            seen[stem] = config_file
+            output_dirs[config_file] = output_root / stem
+        return output_dirs
+
+    @staticmethod
+    def process(
+        generator: CodeGenerator,
+        config_file: Path,
+        output_dir: Path,
+        validate_only: bool = False,
+        layout: str = "single",
+    ) -> Dict[str, Any]:
+        """
+        Parse, validate and generate one config, capturing any failure.
+
+        Args:
+            generator: Generator to render with
+            config_file: Configuration file
+            output_dir: Output directory for this config
+            validate_only: Skip code generation
+            layout: Output layout, see :meth:`CodeGenerator.render`
+
+        Returns:
+            Result with config, output, ok, tools, errors, written and seconds
+        """
+        start = time.perf_counter()
+        result: Dict[str, Any] = {
+            "config": str(config_file),
+            "output": str(output_dir),
+            "ok": False,
+            "tools": 0,
+            "errors": [],
+            "written": [],
+        }
+        try:
+            config = ConfigParser.parse_file(config_file)
+            result["tools"] = len(config.tools)
+            result["errors"] = ConfigValidator.validate(config)
+            if not result["errors"]:
+                if not validate_only:
+                    written = generator.generate(config, output_dir, layout=layout)
+                    result["written"] = [str(path) for path in written]
+                result["ok"] = True
+        except ValidationError as e:
+            result["errors"] = [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            ]
+        except Exception as e:
+            result["errors"] = [str(e)]
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    def run(self, validate_only: bool = False, layout: str = "single") -> List[Dict[str, Any]]:
+        """
+        Generate every config and return the results in input order.
+
+        With a single job the work runs in this process; otherwise each
+        worker reuses its shared generator for all of its configs.
+
+        Args:
+            validate_only: Only parse and validate
+            layout: Output layout, see :meth:`CodeGenerator.render`
+
+        Returns:
+            One result per config, as returned by :meth:`process`
+        """
+        if self.jobs == 1:
+            generator = get_generator()
+            return [
+                self.process(
+                    generator, config_file, self.output_dirs[config_file], validate_only, layout
+                )
+                for config_file in self.config_files
+            ]
+
+        logger.debug(f"Generating {len(self.config_files)} configs with {self.jobs} workers")
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker) as pool:
+            return list(
+                pool.map(
+                    _process,
+                    [str(config_file) for config_file in self.config_files],
+                    [str(self.output_dirs[config_file]) for config_file in self.config_files],
+                    [validate_only] * len(self.config_files),
+                    [layout] * len(self.config_files),
+                )
+            )
@@ -1,97 +1,532 @@
 """Code generator for MCP servers."""
 
+import hashlib
+import json
+import keyword
 import logging
+import os
+import re
+import shutil
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+import jinja2
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, select_autoescape
 
-from ..models import MCPConfig
+from .. import __version__
+from ..models import HttpMethod, MCPConfig, OutputFormat, ServerConfig, Tool
 
 logger = logging.getLogger(__name__)
 
 
+def user_cache_dir() -> Path:
+    """
+    Return the per-user cache directory for mcp-generator.
+
+    ``MCP_GEN_CACHE_DIR`` overrides the platform default
+    (``%LOCALAPPDATA%`` on Windows, ``~/Library/Caches`` on macOS,
+    ``$XDG_CACHE_HOME`` or ``~/.cache`` elsewhere).
+    """
+    override = os.environ.get("MCP_GEN_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "mcp-generator"
+
+
+def template_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Build the persistent template bytecode cache, or None if it cannot be used.
+
+    Compiled templates are stored per Jinja version. Jinja checks each
+    entry against a checksum of the template source, so an edited
+    template is recompiled instead of loaded stale.
+    """
+    directory = user_cache_dir() / f"jinja-{jinja2.__version__}"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+    return FileSystemBytecodeCache(str(directory))
+
+
+@lru_cache(maxsize=None)
+def generator_hash() -> str:
+    """
+    Hash the package version and this module's source.
+
+    Filters and render logic live here, so a change to them invalidates
+    existing outputs even without a version bump.
+    """
+    digest = hashlib.sha256(__version__.encode("utf-8") + b"\0")
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
 class CodeGenerator:
     """Generates MCP server code from configuration."""
 
-    def __init__(self):
-        """Initialize code generator."""
+    # Output file name -> template rendering it
+    OUTPUT_FILES = {
+        "server.py": "server.py.j2",
+        "requirements.txt": "requirements.txt.j2",
+        "README.md": "README.md.j2",
+        ".gitignore": ".gitignore.j2",
+    }
+    MANIFEST_NAME = ".mcp-gen-manifest.json"
+    LAYOUTS = ("single", "package", "data")
+    TOOL_TABLE_FILE = "tools.json"
+    TOOL_TABLE_VERSION = 1
+
+    def __init__(self, bytecode_cache: bool = True):
+        """
+        Initialize code generator.
+
+        Args:
+            bytecode_cache: Load and store compiled templates in the user cache directory
+        """
         # Set up Jinja2 environment
         self.env = Environment(
             loader=PackageLoader("mcp_generator", "templates"),
+            bytecode_cache=template_bytecode_cache() if bytecode_cache else None,
             autoescape=select_autoescape(),
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        self.env.filters["tool_spec"] = self.tool_spec
+        self.env.filters["compact_json"] = self.compact_json
+        self.env.filters["url_expression"] = self.url_expression
+        self.env.filters["projection"] = self.projection
+        self.env.filters["pyrepr"] = repr
+        self.env.filters["docstring"] = self.docstring
+        self.env.globals["raw_passthrough"] = self.raw_passthrough
+        self._templates_hash: Optional[str] = None
+
+    @staticmethod
+    def tool_spec(tool: Tool) -> Dict[str, Any]:
+        """
+        Build the MCP tool definition advertised for a tool.
+
+        Args:
+            tool: Tool configuration
+
+        Returns:
+            Tool definition with name, description and input schema
+        """
+        properties: Dict[str, Any] = {}
+        for param in tool.parameters:
+            prop: Dict[str, Any] = {"type": param.type.value}
+            if param.description:
+                prop["description"] = param.description
+            if param.items_type:
+                prop["items"] = {"type": param.items_type.value}
+            properties[param.name] = prop
+
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": {
+                "type": "object",
+                "properties": properties,
+                "required": [param.name for param in tool.parameters if param.required],
+            },
+        }
+
+    @staticmethod
+    def docstring(text: Any) -> str:
+        """
+        Escape text for use inside a triple-quoted docstring.
+
+        Args:
+            text: Text taken from the configuration, e.g. an OpenAPI description
+
+        Returns:
+            Text with backslashes and double quotes escaped
+        """
+        return str(text).replace("\\", "\\\\").replace('"', '\\"')
+
+    @staticmethod
+    def url_expression(endpoint: str) -> str:
+        """
+        Compile an endpoint template into a Python URL expression.
+
+        The endpoint is split into literal segments and placeholders at
+        generation time, so the generated code only concatenates strings
+        and escapes path values instead of calling str.format and urljoin.
+
+        Args:
+            endpoint: Endpoint path with {param} placeholders
+
+        Returns:
+            Expression appending the endpoint to BASE_PREFIX
+        """
+        parts = ["BASE_PREFIX"]
+        for index, part in enumerate(CodeGenerator.endpoint_parts(endpoint)):
+            if index % 2:
+                parts.append(f"quote_path(arguments[{json.dumps(part)}])")
+            elif part:
+                parts.append(json.dumps(part))
+        return " + ".join(parts)
+
+    @staticmethod
+    def endpoint_parts(endpoint: str) -> List[str]:
+        """
+        Split an endpoint template into literal segments and placeholder names.
+
+        Args:
+            endpoint: Endpoint path with {param} placeholders
+
+        Returns:
+            Alternating literals and parameter names, starting and ending
+            with a (possibly empty) literal, with the leading slash removed
+        """
+        return re.split(r"\{([^}]+)\}", endpoint.lstrip("/"))
+
+    @staticmethod
+    def raw_passthrough(tool: Tool, server: ServerConfig) -> bool:
+        """Whether a tool's JSON response can be passed to the agent without parsing."""
+        output_format = tool.output_format or server.output_format
+        return (
+            output_format != OutputFormat.PRETTY
+            and not tool.stream
+            and not tool.pagination
+            and not (tool.response and (tool.response.fields or tool.response.max_items is not None))
+        )
+
+    @classmethod
+    def tool_table(cls, config: MCPConfig) -> List[Dict[str, Any]]:
+        """
+        Build the data layout's tool table.
+
+        Each entry carries what the generic runtime handler needs: the
+        request line, the URL split by :meth:`endpoint_parts`, the
+        ``[name, required]`` parameters per location, the client call and
+        its options, and the advertised tool definition. Defaults are
+        omitted to keep the table compact.
+
+        Args:
+            config: MCP configuration
+
+        Returns:
+            One entry per tool, in configuration order
+        """
+        table = []
+        for tool in config.tools:
+            entry: Dict[str, Any] = {
+                "name": tool.name,
+                "method": tool.method.value,
+                "endpoint": tool.endpoint,
+                "url": cls.endpoint_parts(tool.endpoint),
+            }
+            for location in ("query", "header", "body"):
+                params = [
+                    [param.name, param.required]
+                    for param in tool.parameters
+                    if param.location.value == location
+                ]
+                if params:
+                    entry[location] = params
+            if cls.raw_passthrough(tool, config.server):
+                entry["raw"] = True
+            if (tool.output_format or config.server.output_format) == OutputFormat.PRETTY:
+                entry["pretty"] = True
+            if tool.stream:
+                entry["call"] = "stream"
+                entry["stream"] = {
+                    "stream_format": tool.stream_options.format.value,
+                    "max_bytes": tool.stream_options.max_bytes,
+                    "max_records": tool.stream_options.max_records,
+                }
+            elif tool.pagination:
+                entry["call"] = "paginate"
+            if tool.cache and tool.method == HttpMethod.GET and tool.cache.key_arguments is not None:
+                entry["cache_key"] = tool.cache.key_arguments
+            entry["spec"] = cls.tool_spec(tool)
+            table.append(entry)
+        return table
+
+    @staticmethod
+    def projection(fields: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """
+        Compile dotted field paths into a nested projection tree.
+
+        Each key maps to None (keep the whole value) or to the tree applied
+        to the nested value, e.g. ["id", "owner.login"] becomes
+        {"id": None, "owner": {"login": None}}.
+
+        Args:
+            fields: Dotted field paths, or None to keep every field
 
-    def generate(self, config: MCPConfig, output_dir: Path) -> None:
+        Returns:
+            Projection tree, or None if no projection applies
+        """
+        if not fields:
+            return None
+        tree: Dict[str, Any] = {}
+        for path in fields:
+            node = tree
+            *parents, leaf = path.split(".")
+            for key in parents:
+                if node.get(key, {}) is None:
+                    break
+                node = node.setdefault(key, {})
+            else:
+                node[leaf] = None
+        return tree
+
+    @staticmethod
+    def compact_json(value: Any) -> str:
+        """Serialize a value as compact JSON."""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+    @staticmethod
+    def group_name(tool: Tool) -> str:
+        """
+        Name the package-layout module holding a tool's handler.
+
+        The tool's first tag is used, falling back to the first literal
+        segment of its endpoint, normalized to a Python identifier.
+
+        Args:
+            tool: Tool configuration
+
+        Returns:
+            Module name for the tool's group
+        """
+        if tool.tags:
+            name = tool.tags[0]
+        else:
+            segments = [part for part in tool.endpoint.split("/") if part and "{" not in part]
+            name = segments[0] if segments else "root"
+        name = re.sub(r"\W+", "_", name.lower()).strip("_") or "root"
+        if name[0].isdigit() or keyword.iskeyword(name):
+            name = f"group_{name}"
+        return name
+
+    @classmethod
+    def tool_groups(cls, tools: List[Tool]) -> Dict[str, List[Tool]]:
+        """Group tools by module name, keeping configuration order within each group."""
+        groups: Dict[str, List[Tool]] = {}
+        for tool in tools:
+            groups.setdefault(cls.group_name(tool), []).append(tool)
+        return groups
+
+    def render(self, config: MCPConfig, layout: str = "single") -> Dict[str, str]:
+        """
+        Render every output file for a layout.
+
+        Args:
+            config: MCP configuration
+            layout: ``single`` for one server.py, ``package`` to put tool
+                handlers in one module per group under tools/, imported on
+                first use, or ``data`` to write the tool table to a
+                tools.json sidecar read by a generic runtime handler
+
+        Returns:
+            File contents keyed by path relative to the output directory
+
+        Raises:
+            ValueError: If the layout is unknown
+        """
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout: {layout}. Supported layouts: {', '.join(self.LAYOUTS)}")
+
+        groups = self.tool_groups(config.tools) if layout == "package" else {}
+        context = {
+            "config": config,
+            "layout": layout,
+            "groups": groups,
+            "tool_table_file": self.TOOL_TABLE_FILE,
+            "tool_table_version": self.TOOL_TABLE_VERSION,
+        }
+        outputs = {
+            file_name: self.env.get_template(template_name).render(**context)
+            for file_name, template_name in self.OUTPUT_FILES.items()
+        }
+        group_template = self.env.get_template("tool_group.py.j2")
+        for group, tools in groups.items():
+            outputs[f"tools/{group}.py"] = group_template.render(config=config, group=group, tools=tools)
+        if layout == "data":
+            outputs[self.TOOL_TABLE_FILE] = self.compact_json(
+                {"version": self.TOOL_TABLE_VERSION, "tools": self.tool_table(config)}
+            ) + "\n"
+        return outputs
+
+    def generate(
+        self, config: MCPConfig, output_dir: Path, force: bool = False, layout: str = "single"
+    ) -> List[Path]:
         """
         Generate MCP server code.
 
+        A manifest in the output directory records hashes of the config,
+        the templates, the layout and the generator's version and source,
+        plus each output file. When none of the inputs changed and the outputs are
+        intact, rendering is skipped; otherwise only files whose content
+        differs are rewritten, each through a temporary file and an atomic
+        rename, and files generated last time but no longer produced are
+        removed.
+
         Args:
             config: MCP configuration
             output_dir: Output directory for generated code
+            force: Render even if the manifest says nothing changed
+            layout: Output layout, see :meth:`render`
+
+        Returns:
+            Files that were written
 
         Raises:
             OSError: If directory creation or file writing fails
+            ValueError: If the layout is unknown
         """
         # Create output directory
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Generating MCP server code in {output_dir}")
+        inputs = {
+            "generator": generator_hash(),
+            "config": self._hash(config.model_dump_json()),
+            "templates": self.templates_hash,
+            "layout": layout,
+        }
+        manifest = self._read_manifest(output_dir)
+        if not force and manifest.get("inputs") == inputs and self._outputs_intact(output_dir, manifest):
+            logger.info(f"{output_dir} is up to date")
+            return []
 
-        # Generate server.py
-        self._generate_file(
-            template_name="server.py.j2",
-            output_path=output_dir / "server.py",
-            context={"config": config},
-        )
+        logger.info(f"Generating MCP server code in {output_dir}")
 
-        # Generate requirements.txt
-        self._generate_file(
-            template_name="requirements.txt.j2",
-            output_path=output_dir / "requirements.txt",
-            context={"config": config},
-        )
+        written = []
+        hashes = {}
+        for file_name, content in self.render(config, layout).items():
+            output_path = output_dir / file_name
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            hashes[file_name] = self._hash(content)
+            if self._write_if_changed(output_path, content):
+                written.append(output_path)
+                logger.debug(f"Generated {output_path}")
 
-        # Generate README.md
-        self._generate_file(
-            template_name="README.md.j2",
-            output_path=output_dir / "README.md",
-            context={"config": config},
-        )
+        root = output_dir.resolve()
+        for file_name in set(manifest.get("files", {})) - set(hashes):
+            stale = (output_dir / file_name).resolve()
+            if stale == root or root not in stale.parents:
+                # Never delete outside the output directory on a tampered manifest
+                logger.warning(f"Ignoring manifest entry outside {output_dir}: {file_name}")
+                continue
+            stale.unlink(missing_ok=True)
+            # The directory may already be gone if it was removed by hand
+            if (
+                stale.parent != root
+                and stale.parent.is_dir()
+                and not any(stale.parent.iterdir())
+            ):
+                stale.parent.rmdir()
+            logger.debug(f"Removed stale {stale}")
 
-        # Generate .gitignore
-        self._generate_file(
-            template_name=".gitignore.j2",
-            output_path=output_dir / ".gitignore",
-            context={"config": config},
-        )
+        new_manifest = {"inputs": inputs, "files": hashes}
+        if new_manifest != manifest:
+            self._write_atomic(
+                output_dir / self.MANIFEST_NAME, json.dumps(new_manifest, indent=2, sort_keys=True) + "\n"
+            )
 
         logger.info("Code generation completed successfully")
-        logger.info(f"Generated files:")
-        logger.info(f"  - {output_dir / 'server.py'}")
-        logger.info(f"  - {output_dir / 'requirements.txt'}")
-        logger.info(f"  - {output_dir / 'README.md'}")
-        logger.info(f"  - {output_dir / '.gitignore'}")
+        if written:
+            logger.info("Updated files:")
+            for output_path in written:
+                logger.info(f"  - {output_path}")
+        else:
+            logger.info("All files were already up to date")
+        return written
 
-    def _generate_file(
-        self, template_name: str, output_path: Path, context: dict
-    ) -> None:
-        """
-        Generate a single file from template.
+    @property
+    def templates_hash(self) -> str:
+        """Hash of every template source, computed once per generator."""
+        if self._templates_hash is None:
+            digest = hashlib.sha256()
+            for name in sorted(self.env.list_templates()):
+                source, _, _ = self.env.loader.get_source(self.env, name)
+                digest.update(name.encode("utf-8") + b"\0" + source.encode("utf-8") + b"\0")
+            self._templates_hash = digest.hexdigest()
+        return self._templates_hash
 
-        Args:
-            template_name: Name of the template file
-            output_path: Output file path
-            context: Template context variables
+    def template_files(self) -> List[Path]:
+        """Return the source files of every template the generator can render."""
+        return [
+            Path(self.env.loader.get_source(self.env, name)[1]) for name in sorted(self.env.list_templates())
+        ]
+
+    def reload_templates(self) -> None:
+        """Drop compiled templates and the template hash after template sources changed."""
+        if self.env.cache is not None:
+            self.env.cache.clear()
+        self._templates_hash = None
+
+    @staticmethod
+    def _hash(content: str) -> str:
+        """Return the SHA-256 hex digest of text."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _read_manifest(cls, output_dir: Path) -> Dict[str, Any]:
+        """Load the output directory's manifest, or an empty one if missing or unreadable."""
+        try:
+            manifest = json.loads((output_dir / cls.MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    @classmethod
+    def _outputs_intact(cls, output_dir: Path, manifest: Dict[str, Any]) -> bool:
+        """Check every output file still has the content recorded in the manifest."""
+        files = manifest.get("files", {})
+        if not files:
+            return False
+        for file_name, digest in files.items():
+            try:
+                content = (output_dir / file_name).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                return False
+            if cls._hash(content) != digest:
+                return False
+        return True
+
+    @classmethod
+    def _write_if_changed(cls, output_path: Path, content: str) -> bool:
+        """Write a file unless it already holds exactly this content."""
+        try:
+            if output_path.read_text(encoding="utf-8") == content:
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        cls._write_atomic(output_path, content)
+        return True
+
+    @staticmethod
+    def _write_atomic(output_path: Path, content: str) -> None:
         """
-        template = self.env.get_template(template_name)
-        content = template.render(**context)
+        Replace a file atomically so readers never see a partial write.
 
-        output_path.write_text(content, encoding="utf-8")
-        logger.debug(f"Generated {output_path}")
+        The temporary file lives next to the target so the rename stays on
+        one filesystem, and an existing file's permissions are kept.
+        """
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+            if output_path.exists():
+                shutil.copymode(output_path, tmp_path)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def preview(self, config: MCPConfig, template_name: str = "server.py.j2") -> str:
         """
@@ -106,3 +541,15 @@ class CodeGenerator:
         """
         template = self.env.get_template(template_name)
         return template.render(config=config)
+
+
+@lru_cache(maxsize=None)
+def get_generator() -> CodeGenerator:
+    """
+    Return the process-wide shared generator.
+
+    Reusing it keeps the Jinja environment and its compiled templates in
+    memory across calls, so only the first render in a process pays for
+    loading them.
+    """
+    return CodeGenerator()
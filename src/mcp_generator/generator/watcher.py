@@ -0,0 +1,128 @@
+"""Regenerate a server whenever its configuration or templates change."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .batch import BatchGenerator
+from .code_generator import CodeGenerator, get_generator
+
+# (mtime_ns, size) of a watched file, or None while it does not exist
+FileStamp = Optional[Tuple[int, int]]
+
+
+class ConfigWatcher:
+    """
+    Polls a config file and the generator's templates and regenerates on change.
+
+    One generator is kept for the watcher's lifetime, so a rebuild only
+    parses, validates and renders; the Jinja environment, compiled templates
+    and imports stay warm. Changes are debounced: a rebuild runs once the
+    watched files have stopped changing for ``debounce`` seconds, so an
+    editor's burst of writes triggers a single rebuild.
+    """
+
+    def __init__(
+        self,
+        config_file: Path,
+        output_dir: Path,
+        generator: Optional[CodeGenerator] = None,
+        interval: float = 0.5,
+        debounce: float = 0.2,
+        layout: str = "single",
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            config_file: Configuration file to watch
+            output_dir: Output directory for generated code
+            generator: Generator to reuse; the shared one by default
+            interval: Seconds between polls
+            debounce: Seconds the files must be unchanged before rebuilding
+            layout: Output layout, see :meth:`CodeGenerator.render`
+        """
+        self.config_file = Path(config_file)
+        self.output_dir = Path(output_dir)
+        self.generator = generator or get_generator()
+        self.interval = interval
+        self.debounce = debounce
+        self.layout = layout
+        self.template_files = self.generator.template_files()
+        self._stamps = self.snapshot()
+        self._changed_at: Optional[float] = None
+        self._templates_changed = False
+
+    @property
+    def watched_files(self) -> List[Path]:
+        """Files whose changes trigger a rebuild."""
+        return [self.config_file] + self.template_files
+
+    @staticmethod
+    def stamp(path: Path) -> FileStamp:
+        """Return a cheap change marker for a file."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def snapshot(self) -> Dict[Path, FileStamp]:
+        """Stamp every watched file."""
+        return {path: self.stamp(path) for path in self.watched_files}
+
+    def rebuild(self) -> Dict[str, Any]:
+        """
+        Validate and regenerate now.
+
+        Returns:
+            Result as returned by :meth:`BatchGenerator.process`
+        """
+        if self._templates_changed:
+            self.generator.reload_templates()
+            self._templates_changed = False
+        return BatchGenerator.process(
+            self.generator, self.config_file, self.output_dir, layout=self.layout
+        )
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """
+        Check the watched files once.
+
+        Returns:
+            The rebuild result if a debounced change was handled, else None
+        """
+        stamps = self.snapshot()
+        if stamps != self._stamps:
+            self._templates_changed |= any(
+                stamps[path] != self._stamps.get(path) for path in self.template_files
+            )
+            self._stamps = stamps
+            self._changed_at = time.monotonic()
+            return None
+
+        if self._changed_at is not None and time.monotonic() - self._changed_at >= self.debounce:
+            self._changed_at = None
+            return self.rebuild()
+        return None
+
+    def run(
+        self,
+        on_result: Callable[[Dict[str, Any]], None],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Build once, then poll and rebuild until stopped.
+
+        Args:
+            on_result: Called with every rebuild result, including the first
+            stop: Event ending the loop; runs until interrupted when omitted
+        """
+        stop = stop or threading.Event()
+        on_result(self.rebuild())
+        while not stop.wait(min(self.interval, self.debounce) if self._changed_at else self.interval):
+            result = self.poll()
+            if result is not None:
+                on_result(result)
@@ -36,6 +36,30 @@ class ParameterType(str, Enum):
     OBJECT = "object"
 
 
+class StreamFormat(str, Enum):
+    """Record framing of a streaming response body."""
+
+    NDJSON = "ndjson"
+    SSE = "sse"
+    TEXT = "text"
+
+
+class OutputFormat(str, Enum):
+    """Serialization of tool results."""
+
+    COMPACT = "compact"
+    PRETTY = "pretty"
+
+
+class PaginationStrategy(str, Enum):
+    """How the next page of a list endpoint is requested."""
+
+    LINK = "link"
+    CURSOR = "cursor"
+    PAGE = "page"
+    OFFSET = "offset"
+
+
 class Parameter(BaseModel):
     """API parameter definition."""
 
@@ -66,6 +90,148 @@ class Authentication(BaseModel):
     description: Optional[str] = Field(None, description="Authentication description")
 
 
+class ConnectionConfig(BaseModel):
+    """HTTP connection pool configuration."""
+
+    max_connections: int = Field(default=100, description="Maximum concurrent connections")
+    max_keepalive_connections: int = Field(
+        default=20, description="Maximum idle connections kept alive in the pool"
+    )
+    keepalive_expiry: float = Field(
+        default=5.0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    http2: bool = Field(default=False, description="Whether to enable HTTP/2")
+
+
+class StreamConfig(BaseModel):
+    """Streaming response configuration for a tool."""
+
+    format: StreamFormat = Field(default=StreamFormat.NDJSON, description="Record framing")
+    max_bytes: int = Field(
+        default=1_048_576, description="Maximum response bytes read before truncating"
+    )
+    max_records: Optional[int] = Field(
+        default=1000, description="Maximum records emitted before truncating"
+    )
+
+
+class CacheConfig(BaseModel):
+    """Response cache configuration for a tool."""
+
+    ttl: float = Field(default=60.0, description="Seconds a cached response stays valid")
+    max_entries: int = Field(default=256, description="Maximum cached responses (LRU eviction)")
+    key_arguments: Optional[List[str]] = Field(
+        None, description="Arguments forming the cache key (defaults to all arguments)"
+    )
+
+
+class ResponseConfig(BaseModel):
+    """Response shaping options for a tool."""
+
+    fields: Optional[List[str]] = Field(
+        None, description="Dotted field paths to keep (applied to each array element)"
+    )
+    max_items: Optional[int] = Field(None, description="Maximum elements kept per array")
+    max_bytes: Optional[int] = Field(
+        None, description="Maximum response bytes read before truncating"
+    )
+    truncation_marker: str = Field(
+        default="...[truncated]", description="Marker appended where output was cut"
+    )
+
+
+class PaginationConfig(BaseModel):
+    """Automatic pagination configuration for a tool."""
+
+    strategy: PaginationStrategy = Field(
+        default=PaginationStrategy.LINK, description="Pagination strategy"
+    )
+    items_path: Optional[str] = Field(
+        None, description="Dotted path to the item array (defaults to the whole response)"
+    )
+    cursor_path: Optional[str] = Field(
+        None, description="Dotted path to the next cursor (cursor strategy)"
+    )
+    cursor_param: str = Field(default="cursor", description="Query parameter carrying the cursor")
+    page_param: str = Field(default="page", description="Query parameter carrying the page")
+    start_page: int = Field(default=1, description="Number of the first page")
+    offset_param: str = Field(default="offset", description="Query parameter carrying the offset")
+    size_param: Optional[str] = Field(None, description="Query parameter carrying the page size")
+    page_size: Optional[int] = Field(None, description="Page size requested when not given")
+    max_pages: int = Field(default=10, description="Maximum pages fetched per call")
+    max_items: int = Field(default=1000, description="Maximum items returned per call")
+    prefetch: bool = Field(
+        default=True, description="Request the next page while the current one is processed"
+    )
+
+
+class ResilienceConfig(BaseModel):
+    """Retry and circuit breaker configuration."""
+
+    max_retries: int = Field(default=2, description="Maximum retries after the first attempt")
+    backoff_base: float = Field(default=0.5, description="Initial backoff delay in seconds")
+    backoff_max: float = Field(default=10.0, description="Maximum backoff delay in seconds")
+    jitter: bool = Field(default=True, description="Randomize backoff delays (full jitter)")
+    retry_on_status: List[int] = Field(
+        default_factory=lambda: [429, 502, 503, 504],
+        description="HTTP status codes that trigger a retry",
+    )
+    idempotent_only: bool = Field(
+        default=True, description="Only retry idempotent methods (GET, PUT, DELETE)"
+    )
+    max_retry_after: float = Field(
+        default=60.0,
+        description="Longest Retry-After honoured in seconds; longer ones fail the call",
+    )
+    circuit_failure_threshold: int = Field(
+        default=5, description="Consecutive failures that open the circuit (0 disables it)"
+    )
+    circuit_reset_timeout: float = Field(
+        default=30.0, description="Seconds the circuit stays open before a trial request"
+    )
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side token bucket rate limit."""
+
+    rate: float = Field(..., description="Requests per second")
+    burst: int = Field(default=1, description="Maximum burst size (bucket capacity)")
+
+
+class BatchConfig(BaseModel):
+    """Configuration of the built-in batch meta-tool."""
+
+    enabled: bool = Field(default=False, description="Whether to generate the batch tool")
+    name: str = Field(default="batch", description="Name of the batch tool")
+    max_concurrency: int = Field(default=10, description="Maximum calls run concurrently")
+    max_items: int = Field(default=100, description="Maximum calls per batch")
+
+
+class MetricsConfig(BaseModel):
+    """Metrics collection and exposition configuration."""
+
+    enabled: bool = Field(default=False, description="Whether to collect metrics")
+    host: str = Field(default="127.0.0.1", description="Interface of the metrics endpoint")
+    port: Optional[int] = Field(None, description="Serve Prometheus text on this local port")
+    file: Optional[str] = Field(None, description="Periodically write Prometheus text here")
+    interval: float = Field(default=15.0, description="Seconds between file dumps")
+    buckets: List[float] = Field(
+        default_factory=lambda: [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+        description="Upstream latency histogram bucket bounds in seconds",
+    )
+
+
+class TracingConfig(BaseModel):
+    """Sampled request tracing configuration."""
+
+    enabled: bool = Field(default=False, description="Whether to record traces")
+    file: str = Field(default="traces.jsonl", description="JSONL file traces are appended to")
+    sample_rate: float = Field(default=0.1, description="Fraction of tool calls traced (0-1)")
+    max_pending: int = Field(
+        default=10000, description="Traces buffered for writing before new ones are dropped"
+    )
+
+
 class Tool(BaseModel):
     """MCP tool definition mapping to an API endpoint."""
 
@@ -75,7 +241,31 @@ class Tool(BaseModel):
     method: HttpMethod = Field(..., description="HTTP method")
     parameters: List[Parameter] = Field(default_factory=list, description="Tool parameters")
     response_description: Optional[str] = Field(None, description="Response description")
+    tags: List[str] = Field(
+        default_factory=list,
+        description="Tool tags; the first one names the tool's module in the package layout",
+    )
     stream: bool = Field(default=False, description="Whether this endpoint supports streaming")
+    stream_options: StreamConfig = Field(
+        default_factory=StreamConfig, description="Streaming response options"
+    )
+    cache: Optional[CacheConfig] = Field(
+        None, description="Response cache config (GET tools only)"
+    )
+    output_format: Optional[OutputFormat] = Field(
+        None, description="Result serialization (defaults to the server setting)"
+    )
+    response: Optional[ResponseConfig] = Field(
+        None, description="Response projection and size caps"
+    )
+    pagination: Optional[PaginationConfig] = Field(
+        None, description="Follow pages and aggregate their items"
+    )
+    resilience: Optional[ResilienceConfig] = Field(
+        None, description="Retry policy override (circuit breaking stays per host)"
+    )
+    rate_limit: Optional[RateLimitConfig] = Field(None, description="Tool rate limit")
+    max_concurrency: Optional[int] = Field(None, description="Maximum concurrent tool requests")
 
 
 class ServerConfig(BaseModel):
@@ -87,6 +277,30 @@ class ServerConfig(BaseModel):
     base_url: HttpUrl = Field(..., description="Base URL of the target API")
     timeout: int = Field(default=30, description="Request timeout in seconds")
     authentication: Optional[Authentication] = Field(None, description="Authentication config")
+    connection: ConnectionConfig = Field(
+        default_factory=ConnectionConfig, description="HTTP connection pool config"
+    )
+    output_format: OutputFormat = Field(
+        default=OutputFormat.COMPACT, description="Default result serialization"
+    )
+    resilience: Optional[ResilienceConfig] = Field(
+        None, description="Retry and circuit breaker config"
+    )
+    rate_limit: Optional[RateLimitConfig] = Field(None, description="Server-wide rate limit")
+    max_concurrency: Optional[int] = Field(
+        None, description="Maximum concurrent upstream requests"
+    )
+    batch: BatchConfig = Field(default_factory=BatchConfig, description="Batch meta-tool config")
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig, description="Metrics config")
+    tracing: TracingConfig = Field(default_factory=TracingConfig, description="Tracing config")
+    single_flight: bool = Field(
+        default=False,
+        description="Share one upstream request between concurrent identical GET calls",
+    )
+    preserialize_tools: bool = Field(
+        default=False,
+        description="Embed tool definitions as pre-serialized JSON decoded once at import",
+    )
 
 
 class MCPConfig(BaseModel):
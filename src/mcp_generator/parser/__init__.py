@@ -1,5 +1,6 @@
 """Configuration parser module."""
 
 from .config_parser import ConfigParser
+from .openapi_importer import OpenAPIImporter
 
-__all__ = ["ConfigParser"]
+__all__ = ["ConfigParser", "OpenAPIImporter"]
@@ -4,7 +4,6 @@ import json
 from pathlib import Path
 from typing import Union
 
-import yaml
 from pydantic import ValidationError
 
 from ..models import MCPConfig
@@ -40,18 +39,24 @@ class ConfigParser:
         # Parse based on file extension
         suffix = file_path.suffix.lower()
 
-        try:
-            if suffix in [".yaml", ".yml"]:
+        if suffix in [".yaml", ".yml"]:
+            # Imported here so JSON configs never load yaml
+            import yaml
+
+            try:
                 data = yaml.safe_load(content)
-            elif suffix == ".json":
+            except yaml.YAMLError as e:
+                raise ValueError(f"Failed to parse file: {e}") from e
+        elif suffix == ".json":
+            try:
                 data = json.loads(content)
-            else:
-                raise ValueError(
-                    f"Unsupported file format: {suffix}. "
-                    f"Supported formats: .yaml, .yml, .json"
-                )
-        except (yaml.YAMLError, json.JSONDecodeError) as e:
-            raise ValueError(f"Failed to parse file: {e}") from e
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Failed to parse file: {e}") from e
+        else:
+            raise ValueError(
+                f"Unsupported file format: {suffix}. "
+                f"Supported formats: .yaml, .yml, .json"
+            )
 
         # Validate and create model
         try:
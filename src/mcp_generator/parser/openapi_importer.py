@@ -0,0 +1,607 @@
+"""OpenAPI 3 importer."""
+
+import json
+import os
+import re
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from ..models import (
+    Authentication,
+    HttpMethod,
+    MCPConfig,
+    Parameter,
+    ParameterLocation,
+    ParameterType,
+    ServerConfig,
+    Tool,
+)
+
+PYTHON_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# (path, method, operation, path-level parameters)
+Operation = Tuple[str, str, Dict[str, Any], List[Any]]
+
+
+class OpenAPIImporter:
+    """
+    Converts the operations of an OpenAPI 3 document into MCP tools.
+
+    The document is loaded once and never copied: operations are visited
+    path by path, filtered before any of their references are resolved,
+    and converted into one :class:`Tool` at a time. ``$ref`` lookups and
+    converted schemas are memoized per reference, so a component shared
+    by thousands of operations is resolved and converted once.
+
+    Operations that cannot be expressed as a tool (a required cookie
+    parameter, a non-object request body, an external reference, ...) are
+    skipped and described in :attr:`warnings` instead of failing the import.
+    """
+
+    HTTP_METHODS = tuple(method.value.lower() for method in HttpMethod)
+    SCHEMA_TYPES = {member.value: member for member in ParameterType}
+
+    # Levels of nested object properties kept below a parameter
+    MAX_SCHEMA_DEPTH = 2
+
+    def __init__(
+        self,
+        document: Dict[str, Any],
+        tags: Optional[Iterable[str]] = None,
+        paths: Optional[Iterable[str]] = None,
+        base_url: Optional[str] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        Initialize importer.
+
+        Args:
+            document: Parsed OpenAPI 3 document
+            tags: Only import operations having one of these tags
+            paths: Only import paths matching one of these glob patterns
+            base_url: Target API URL overriding the document's servers
+            name: Server name overriding the one derived from the title
+
+        Raises:
+            ValueError: If the document is not an OpenAPI 3 document
+        """
+        if not isinstance(document, dict) or not str(document.get("openapi", "")).startswith("3"):
+            raise ValueError("Not an OpenAPI 3 document (missing or unsupported 'openapi' version)")
+        self.document = document
+        self.tags = set(tags) if tags else None
+        self.paths = list(paths) if paths else None
+        self.base_url = base_url
+        self.name = name
+        self.warnings: List[str] = []
+        self._refs: Dict[str, Any] = {}
+        self._schemas: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._tool_names: Set[str] = set()
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path], **options: Any) -> "OpenAPIImporter":
+        """
+        Create an importer for an OpenAPI file.
+
+        Args:
+            file_path: Path to a YAML or JSON OpenAPI document
+            **options: Passed to the constructor
+
+        Returns:
+            Importer for the document
+        """
+        return cls(cls.load(file_path), **options)
+
+    @staticmethod
+    def load(file_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Parse an OpenAPI document from a YAML or JSON file.
+
+        JSON is parsed with orjson and YAML with libyaml when available,
+        which is what keeps multi-megabyte specs fast to load.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            Parsed document
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is invalid
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"OpenAPI file not found: {file_path}")
+
+        suffix = file_path.suffix.lower()
+
+        if suffix == ".json":
+            data = file_path.read_bytes()
+            try:
+                import orjson
+            except ImportError:
+                loads = json.loads
+            else:
+                loads = orjson.loads
+            try:
+                return loads(data)
+            except ValueError as e:
+                raise ValueError(f"Failed to parse file: {e}") from e
+        elif suffix in [".yaml", ".yml"]:
+            import yaml
+
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            try:
+                with file_path.open("rb") as f:
+                    return yaml.load(f, Loader=loader)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Failed to parse file: {e}") from e
+        else:
+            raise ValueError(
+                f"Unsupported file format: {suffix}. "
+                f"Supported formats: .yaml, .yml, .json"
+            )
+
+    def server_config(self) -> ServerConfig:
+        """
+        Build the server configuration from the document's info, servers and security.
+
+        Raises:
+            ValueError: If no absolute base URL is known
+        """
+        info = self.document.get("info") or {}
+        title = str(info.get("title") or "openapi")
+        description = str(info.get("description") or title).strip().splitlines()[0]
+
+        return ServerConfig(
+            name=self.name or re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "openapi",
+            version=str(info.get("version") or "1.0.0"),
+            description=description,
+            base_url=self.base_url or self._server_url(),
+            authentication=self._authentication(),
+        )
+
+    def operations(self) -> Iterator[Operation]:
+        """
+        Yield the operations passing the tag and path filters.
+
+        Path items are visited in document order. Path patterns are matched
+        before the path item is resolved, and tags before any parameter or
+        schema is touched, so filtered-out operations cost almost nothing.
+        """
+        for path, path_item in (self.document.get("paths") or {}).items():
+            if self.paths and not any(fnmatchcase(path, pattern) for pattern in self.paths):
+                continue
+            try:
+                path_item = self._deref(path_item)
+            except ValueError as e:
+                self.warnings.append(f"Skipped {path}: {e}")
+                continue
+            for method in self.HTTP_METHODS:
+                operation = path_item.get(method)
+                if not isinstance(operation, dict):
+                    continue
+                if self.tags and not self.tags.intersection(operation.get("tags") or ()):
+                    continue
+                yield path, method, operation, path_item.get("parameters") or []
+
+    def iter_tools(self) -> Iterator[Tool]:
+        """Convert the selected operations one at a time."""
+        for path, method, operation, shared_parameters in self.operations():
+            try:
+                tool = self._tool(path, method, operation, shared_parameters)
+            except ValueError as e:
+                self.warnings.append(f"Skipped {method.upper()} {path}: {e}")
+                continue
+            self._tool_names.add(tool.name)
+            yield tool
+
+    def to_config(self) -> MCPConfig:
+        """Convert the whole document into a configuration held in memory."""
+        return MCPConfig(server=self.server_config(), tools=list(self.iter_tools()))
+
+    def write(self, output_path: Union[str, Path]) -> int:
+        """
+        Write a generator configuration, streaming tools as they are converted.
+
+        Only one converted tool is held at a time. The file is written next
+        to its destination and renamed into place once complete.
+
+        Args:
+            output_path: ``.yaml``, ``.yml`` or ``.json`` file to write
+
+        Returns:
+            Number of tools written
+
+        Raises:
+            ValueError: If the output format is unsupported or no base URL is known
+        """
+        output_path = Path(output_path)
+        suffix = output_path.suffix.lower()
+        if suffix not in (".yaml", ".yml", ".json"):
+            raise ValueError(
+                f"Unsupported file format: {suffix}. "
+                f"Supported formats: .yaml, .yml, .json"
+            )
+
+        server = self.server_config().model_dump(mode="json", exclude_defaults=True)
+        tools = (
+            tool.model_dump(mode="json", exclude_defaults=True) for tool in self.iter_tools()
+        )
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                if suffix == ".json":
+                    count = self._write_json(f, server, tools)
+                else:
+                    count = self._write_yaml(f, server, tools)
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return count
+
+    @staticmethod
+    def _write_json(f, server: Dict[str, Any], tools: Iterator[Dict[str, Any]]) -> int:
+        """Write the config as JSON with one tool per line."""
+        count = 0
+        f.write('{\n"server": ' + json.dumps(server, ensure_ascii=False) + ',\n"tools": [')
+        for tool in tools:
+            f.write(("," if count else "") + "\n" + json.dumps(tool, ensure_ascii=False))
+            count += 1
+        f.write("\n]\n}\n")
+        return count
+
+    @staticmethod
+    def _write_yaml(f, server: Dict[str, Any], tools: Iterator[Dict[str, Any]]) -> int:
+        """Write the config as YAML, appending one tool list item at a time."""
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+        def dump(data: Any) -> str:
+            return yaml.dump(data, Dumper=dumper, sort_keys=False, allow_unicode=True)
+
+        count = 0
+        f.write(dump({"server": server}) + "\ntools:")
+        for tool in tools:
+            f.write("\n" + dump([tool]).rstrip("\n"))
+            count += 1
+        f.write("\n" if count else " []\n")
+        return count
+
+    def _tool(
+        self, path: str, method: str, operation: Dict[str, Any], shared_parameters: List[Any]
+    ) -> Tool:
+        """Convert one operation."""
+        parameters: Dict[str, Parameter] = {}
+        endpoint = path
+
+        # Operation parameters override path-level ones with the same name and location
+        declared: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for raw in list(shared_parameters) + list(operation.get("parameters") or []):
+            spec = self._deref(raw)
+            declared[(spec.get("name"), spec.get("in"))] = spec
+
+        for (name, location), spec in declared.items():
+            name = str(name or "")
+            required = bool(spec.get("required")) or location == "path"
+            if location not in ("path", "query", "header"):
+                self._drop(f"{location} parameter '{name}'", required)
+                continue
+            if location == "path" and not PYTHON_IDENTIFIER_PATTERN.match(name):
+                # Only the position of a path placeholder matters, so it can be renamed
+                identifier = re.sub(r"\W", "_", name, flags=re.ASCII)
+                if not PYTHON_IDENTIFIER_PATTERN.match(identifier):
+                    identifier = f"_{identifier}"
+                endpoint = endpoint.replace("{" + name + "}", "{" + identifier + "}")
+                name = identifier
+            schema = spec.get("schema")
+            if schema is None:
+                schema = next(iter((spec.get("content") or {}).values()), {}).get("schema", {})
+            self._add(
+                parameters,
+                self._parameter(name, schema, required, ParameterLocation(location), spec),
+            )
+
+        # Placeholders the document forgot to declare are passed as strings
+        for name in re.findall(r"\{([^}]+)\}", endpoint):
+            if name not in parameters:
+                parameter = Parameter(
+                    name=name,
+                    type=ParameterType.STRING,
+                    location=ParameterLocation.PATH,
+                    required=True,
+                )
+                self._add(parameters, parameter)
+
+        if operation.get("requestBody") is not None:
+            self._add_body(parameters, self._deref(operation["requestBody"]))
+
+        return Tool(
+            name=self._tool_name(path, method, operation),
+            description=self._description(operation) or f"{method.upper()} {path}",
+            endpoint=endpoint,
+            method=HttpMethod(method.upper()),
+            parameters=list(parameters.values()),
+            response_description=self._response_description(operation),
+            tags=[str(tag) for tag in operation.get("tags") or []],
+        )
+
+    def _add_body(self, parameters: Dict[str, Parameter], request_body: Dict[str, Any]) -> None:
+        """Add the properties of a JSON object request body as body parameters."""
+        required = bool(request_body.get("required"))
+        content = request_body.get("content") or {}
+        media_type = next((key for key in content if "json" in key), None)
+        if media_type is None:
+            self._drop(f"request body of type {', '.join(content) or 'unknown'}", required)
+            return
+
+        schema = self._flatten(content[media_type].get("schema") or {})
+        if self._type(schema) != ParameterType.OBJECT or not schema.get("properties"):
+            self._drop("request body that is not an object with properties", required)
+            return
+
+        required_properties = set(schema.get("required") or ()) if required else set()
+        for name, property_schema in schema["properties"].items():
+            parameter = self._parameter(
+                name, property_schema, name in required_properties, ParameterLocation.BODY
+            )
+            self._add(parameters, parameter)
+
+    def _add(self, parameters: Dict[str, Parameter], parameter: Parameter) -> None:
+        """Add a parameter, dropping it if its name cannot be used as an argument."""
+        name = parameter.name
+        if not PYTHON_IDENTIFIER_PATTERN.match(name):
+            self._drop(
+                f"{parameter.location.value} parameter '{name}' (not an identifier)",
+                parameter.required,
+            )
+        elif name in parameters:
+            self._drop(
+                f"{parameter.location.value} parameter '{name}' (name clash)", parameter.required
+            )
+        elif parameter.type == ParameterType.OBJECT and not parameter.properties:
+            self._drop(f"free-form object parameter '{name}'", parameter.required)
+        else:
+            parameters[name] = parameter
+
+    def _drop(self, what: str, required: bool) -> None:
+        """Skip an optional part of an operation, or the whole operation if it is required."""
+        if required:
+            raise ValueError(f"unsupported required {what}")
+        self.warnings.append(f"Ignored optional {what}")
+
+    def _parameter(
+        self,
+        name: str,
+        schema: Any,
+        required: bool,
+        location: ParameterLocation,
+        spec: Optional[Dict[str, Any]] = None,
+    ) -> Parameter:
+        """Build a parameter from its schema."""
+        fields = self._schema_fields(schema, 0)
+        description = (spec or {}).get("description") or fields.get("description")
+        return Parameter(
+            name=name,
+            type=fields["type"],
+            location=location,
+            description=description,
+            required=required,
+            default=fields.get("default"),
+            items_type=fields.get("items_type"),
+            properties=fields.get("properties"),
+        )
+
+    def _schema_fields(self, schema: Any, depth: int) -> Dict[str, Any]:
+        """
+        Convert a schema into parameter fields, memoized per ``$ref`` and depth.
+
+        Nesting stops at :attr:`MAX_SCHEMA_DEPTH`, which also ends recursive
+        schemas; referenced schemas count towards the depth like inline ones.
+        """
+        ref = schema.get("$ref") if isinstance(schema, dict) else None
+        if ref is not None:
+            key = (ref, depth)
+            if key not in self._schemas:
+                self._schemas[key] = self._schema_fields(self._resolve(ref), depth)
+            return self._schemas[key]
+
+        schema = self._flatten(schema)
+        fields: Dict[str, Any] = {"type": self._type(schema)}
+        if schema.get("description"):
+            fields["description"] = str(schema["description"])
+        if schema.get("default") is not None:
+            fields["default"] = schema["default"]
+        if fields["type"] == ParameterType.ARRAY:
+            fields["items_type"] = self._type(self._flatten(schema.get("items") or {}))
+        elif fields["type"] == ParameterType.OBJECT and depth < self.MAX_SCHEMA_DEPTH:
+            required = set(schema.get("required") or ())
+            properties = {}
+            for name, property_schema in (schema.get("properties") or {}).items():
+                nested = self._schema_fields(property_schema, depth + 1)
+                properties[name] = Parameter(
+                    name=name,
+                    type=nested["type"],
+                    location=ParameterLocation.BODY,
+                    description=nested.get("description"),
+                    required=name in required,
+                    items_type=nested.get("items_type"),
+                    properties=nested.get("properties"),
+                )
+            fields["properties"] = properties or None
+        return fields
+
+    def _flatten(self, schema: Any, seen: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+        """
+        Resolve a schema and merge its ``allOf`` parts.
+
+        ``oneOf`` and ``anyOf`` are represented by their first alternative.
+        A new dict is only built when parts have to be merged. ``seen`` holds
+        the references already followed on the way here, so a schema that
+        includes itself is reported instead of recursing forever.
+
+        Raises:
+            ValueError: If the schema includes itself
+        """
+        refs = set(seen)
+        schema = self._deref(schema, refs) if isinstance(schema, dict) else {}
+        for combinator in ("oneOf", "anyOf"):
+            if schema.get(combinator) and "type" not in schema and "properties" not in schema:
+                schema = self._flatten(schema[combinator][0], frozenset(refs))
+        if not schema.get("allOf"):
+            return schema
+
+        merged: Dict[str, Any] = {key: value for key, value in schema.items() if key != "allOf"}
+        properties = dict(merged.get("properties") or {})
+        required = list(merged.get("required") or ())
+        for part in schema["allOf"]:
+            part = self._flatten(part, frozenset(refs))
+            properties.update(part.get("properties") or {})
+            required.extend(part.get("required") or ())
+            for key in ("type", "description", "items"):
+                if key in part:
+                    merged.setdefault(key, part[key])
+        if properties:
+            merged["properties"] = properties
+        merged["required"] = required
+        return merged
+
+    @classmethod
+    def _type(cls, schema: Dict[str, Any]) -> ParameterType:
+        """Map a resolved schema to a parameter type."""
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):
+            # OpenAPI 3.1 nullable types, e.g. ["string", "null"]
+            schema_type = next((item for item in schema_type if item != "null"), None)
+        if schema_type in cls.SCHEMA_TYPES:
+            return cls.SCHEMA_TYPES[schema_type]
+        if "properties" in schema:
+            return ParameterType.OBJECT
+        if "items" in schema:
+            return ParameterType.ARRAY
+        return ParameterType.STRING
+
+    def _deref(self, node: Any, seen: Optional[Set[str]] = None) -> Any:
+        """
+        Follow ``$ref`` chains until a concrete node is reached.
+
+        Args:
+            node: Node that may be a reference
+            seen: References already followed; updated with the ones followed here
+
+        Raises:
+            ValueError: If a reference is circular or cannot be resolved
+        """
+        seen = set() if seen is None else seen
+        while isinstance(node, dict) and "$ref" in node:
+            ref = node["$ref"]
+            if ref in seen:
+                raise ValueError(f"circular reference {ref}")
+            seen.add(ref)
+            node = self._resolve(ref)
+        return node
+
+    def _resolve(self, ref: str) -> Any:
+        """
+        Look up a local JSON pointer reference, memoized.
+
+        Raises:
+            ValueError: If the reference is external or points nowhere
+        """
+        if ref in self._refs:
+            return self._refs[ref]
+        if not ref.startswith("#/"):
+            raise ValueError(f"external reference {ref} is not supported")
+
+        node: Any = self.document
+        for token in ref[2:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValueError(f"unresolvable reference {ref}") from None
+        self._refs[ref] = node
+        return node
+
+    def _tool_name(self, path: str, method: str, operation: Dict[str, Any]) -> str:
+        """Derive a unique snake_case tool name from the operationId or method and path."""
+        raw = operation.get("operationId") or " ".join(
+            [method] + [segment.strip("{}") for segment in path.split("/") if segment]
+        )
+        name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", str(raw))
+        name = re.sub(r"[^0-9a-zA-Z]+", "_", name).strip("_").lower() or method
+        if name[0].isdigit():
+            name = f"op_{name}"
+
+        unique, suffix = name, 2
+        while unique in self._tool_names:
+            unique, suffix = f"{name}_{suffix}", suffix + 1
+        return unique
+
+    @staticmethod
+    def _description(operation: Dict[str, Any]) -> Optional[str]:
+        """Prefer the short summary; long descriptions bloat every tools/list response."""
+        if operation.get("summary"):
+            return str(operation["summary"]).strip()
+        if operation.get("description"):
+            return str(operation["description"]).strip().split("\n\n")[0]
+        return None
+
+    def _response_description(self, operation: Dict[str, Any]) -> Optional[str]:
+        """Describe the first successful response."""
+        for code, response in (operation.get("responses") or {}).items():
+            if str(code).startswith("2"):
+                try:
+                    description = self._deref(response).get("description")
+                except ValueError:
+                    return None
+                return str(description).strip() if description else None
+        return None
+
+    def _server_url(self) -> str:
+        """
+        Return the first server URL with its variables substituted.
+
+        Raises:
+            ValueError: If the document has no absolute server URL
+        """
+        servers = self.document.get("servers") or []
+        if servers:
+            server = servers[0]
+            url = str(server.get("url", ""))
+            for variable, spec in (server.get("variables") or {}).items():
+                url = url.replace("{" + variable + "}", str(spec.get("default", "")))
+            if url.startswith(("http://", "https://")):
+                return url
+        raise ValueError("The document has no absolute server URL; pass a base URL explicitly")
+
+    def _authentication(self) -> Optional[Authentication]:
+        """Map the first supported security scheme to an authentication config."""
+        schemes = (self.document.get("components") or {}).get("securitySchemes") or {}
+        requirements = self.document.get("security") or []
+        names = [name for requirement in requirements for name in requirement]
+        for name in names or list(schemes):
+            try:
+                scheme = self._deref(schemes.get(name)) or {}
+            except ValueError:
+                continue
+            scheme_type = scheme.get("type")
+            http_scheme = str(scheme.get("scheme", "")).lower()
+            description = scheme.get("description")
+            if scheme_type == "http" and http_scheme in ("bearer", "basic"):
+                return Authentication(type=http_scheme, description=description)
+            if scheme_type in ("oauth2", "openIdConnect"):
+                return Authentication(type="bearer", description=description)
+            if scheme_type == "apiKey" and scheme.get("in") in ("header", "query"):
+                return Authentication(
+                    type="apikey",
+                    location=ParameterLocation(scheme["in"]),
+                    name=scheme.get("name"),
+                    description=description,
+                )
+        return None
@@ -0,0 +1,5 @@
+"""Trace analysis module."""
+
+from .trace_report import TraceReport
+
+__all__ = ["TraceReport"]
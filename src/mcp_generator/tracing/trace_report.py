@@ -0,0 +1,103 @@
+"""Summaries of traces recorded by generated servers."""
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+
+class TraceReport:
+    """Summarizes JSONL trace files into per-phase latency percentiles."""
+
+    PERCENTILES = (50, 90, 95, 99)
+
+    @staticmethod
+    def read(file_path: Union[str, Path], tool: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Read trace records from a JSONL file.
+
+        Args:
+            file_path: Path to the trace file
+            tool: Only yield traces of this tool
+
+        Yields:
+            Trace records
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If a line is not valid JSON
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Trace file not found: {file_path}")
+
+        with file_path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Invalid trace on line {line_number}: {e}") from e
+                if tool is None or record.get("tool") == tool:
+                    yield record
+
+    @classmethod
+    def summarize(cls, records: Iterator[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """
+        Compute latency statistics per phase.
+
+        Span durations are summed per trace first, so phases that occur
+        several times in one call (retries, pages) count once per call.
+        The "total" phase is the end-to-end duration of the tool call.
+
+        Args:
+            records: Trace records
+
+        Returns:
+            Mapping of phase name to count, mean, max and percentiles in ms
+        """
+        durations: Dict[str, List[float]] = {"total": []}
+        errors = 0
+        for record in records:
+            durations["total"].append(record["duration_ms"])
+            errors += bool(record.get("error"))
+            phases: Dict[str, float] = {}
+            for span in record.get("spans", []):
+                phases[span["name"]] = phases.get(span["name"], 0.0) + span["duration_ms"]
+            for name, duration in phases.items():
+                durations.setdefault(name, []).append(duration)
+
+        summary: Dict[str, Dict[str, float]] = {}
+        for name, values in durations.items():
+            if not values:
+                continue
+            values.sort()
+            stats = {
+                "count": len(values),
+                "mean": sum(values) / len(values),
+                "max": values[-1],
+            }
+            for pct in cls.PERCENTILES:
+                stats[f"p{pct}"] = cls.percentile(values, pct)
+            summary[name] = stats
+        if durations["total"]:
+            summary["total"]["errors"] = errors
+        return summary
+
+    @staticmethod
+    def percentile(sorted_values: Sequence[float], pct: float) -> float:
+        """
+        Return the nearest-rank percentile of sorted values.
+
+        Args:
+            sorted_values: Values in ascending order
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Smallest value with at least pct percent of values at or below it
+        """
+        if not sorted_values:
+            raise ValueError("Cannot compute a percentile of no values")
+        rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+        return sorted_values[rank - 1]
@@ -1,9 +1,15 @@
 """Configuration validator."""
 
 import re
-from typing import List
+from typing import List, Optional
 
-from ..models import MCPConfig, Tool
+from ..models import (
+    MCPConfig,
+    PaginationStrategy,
+    RateLimitConfig,
+    ResilienceConfig,
+    Tool,
+)
 
 
 class ConfigValidator:
@@ -28,6 +34,44 @@ class ConfigValidator:
         if not config.server.name:
             errors.append("Server name is required")
 
+        # Validate connection pool settings
+        errors.extend(cls._validate_connection(config))
+
+        # Validate resilience settings
+        if config.server.resilience:
+            errors.extend(cls._validate_resilience("Server", config.server.resilience))
+
+        # Validate server-wide limits
+        errors.extend(
+            cls._validate_limits("Server", config.server.rate_limit, config.server.max_concurrency)
+        )
+
+        # Validate batch meta-tool
+        batch = config.server.batch
+        if batch.enabled:
+            if not cls.PYTHON_IDENTIFIER_PATTERN.match(batch.name):
+                errors.append(f"Batch tool name '{batch.name}' is not a valid Python identifier")
+            if any(tool.name == batch.name for tool in config.tools):
+                errors.append(f"Batch tool name '{batch.name}' clashes with a configured tool")
+            if batch.max_concurrency < 1:
+                errors.append("Batch max_concurrency must be at least 1")
+            if batch.max_items < 1:
+                errors.append("Batch max_items must be at least 1")
+
+        # Validate metrics exposition
+        if config.server.metrics.enabled:
+            errors.extend(cls._validate_metrics(config))
+
+        # Validate tracing
+        tracing = config.server.tracing
+        if tracing.enabled:
+            if not tracing.file:
+                errors.append("Tracing file is required")
+            if not 0 <= tracing.sample_rate <= 1:
+                errors.append("Tracing sample_rate must be between 0 and 1")
+            if tracing.max_pending < 1:
+                errors.append("Tracing max_pending must be at least 1")
+
         # Validate tools
         if not config.tools:
             errors.append("At least one tool is required")
@@ -54,6 +98,195 @@ class ConfigValidator:
             # Validate parameters
             errors.extend(cls._validate_tool_parameters(tool))
 
+            # Validate response cache
+            if tool.cache:
+                errors.extend(cls._validate_tool_cache(tool))
+
+            # Validate response shaping
+            if tool.response:
+                errors.extend(cls._validate_tool_response(tool))
+
+            # Validate pagination
+            if tool.pagination:
+                errors.extend(cls._validate_tool_pagination(tool))
+
+            # Validate retry policy override
+            if tool.resilience:
+                errors.extend(cls._validate_resilience(f"Tool '{tool.name}'", tool.resilience))
+
+            # Validate rate and concurrency limits
+            errors.extend(
+                cls._validate_limits(f"Tool '{tool.name}'", tool.rate_limit, tool.max_concurrency)
+            )
+
+            # Validate streaming options
+            if tool.stream:
+                errors.extend(cls._validate_tool_stream(tool))
+
+        return errors
+
+    @classmethod
+    def _validate_connection(cls, config: MCPConfig) -> List[str]:
+        """Validate connection pool settings."""
+        errors: List[str] = []
+        connection = config.server.connection
+
+        if connection.max_connections < 1:
+            errors.append("Connection max_connections must be at least 1")
+        if connection.max_keepalive_connections < 0:
+            errors.append("Connection max_keepalive_connections must not be negative")
+        elif connection.max_keepalive_connections > connection.max_connections:
+            errors.append(
+                "Connection max_keepalive_connections must not exceed max_connections"
+            )
+        if connection.keepalive_expiry < 0:
+            errors.append("Connection keepalive_expiry must not be negative")
+
+        return errors
+
+    @classmethod
+    def _validate_metrics(cls, config: MCPConfig) -> List[str]:
+        """Validate metrics settings."""
+        errors: List[str] = []
+        metrics = config.server.metrics
+
+        if metrics.port is not None and not 1 <= metrics.port <= 65535:
+            errors.append(f"Metrics port {metrics.port} is out of range")
+        if metrics.interval <= 0:
+            errors.append("Metrics interval must be positive")
+        if not metrics.buckets:
+            errors.append("Metrics buckets must not be empty")
+        elif any(low >= high for low, high in zip(metrics.buckets, metrics.buckets[1:])):
+            errors.append("Metrics buckets must be strictly increasing")
+
+        return errors
+
+    @classmethod
+    def _validate_resilience(cls, owner: str, resilience: ResilienceConfig) -> List[str]:
+        """Validate retry and circuit breaker settings."""
+        errors: List[str] = []
+
+        if resilience.max_retries < 0:
+            errors.append(f"{owner}: resilience max_retries must not be negative")
+        if resilience.backoff_base < 0:
+            errors.append(f"{owner}: resilience backoff_base must not be negative")
+        if resilience.backoff_max < resilience.backoff_base:
+            errors.append(f"{owner}: resilience backoff_max must not be below backoff_base")
+        for status in resilience.retry_on_status:
+            if not 100 <= status <= 599:
+                errors.append(f"{owner}: invalid retry status code {status}")
+        if resilience.max_retry_after < 0:
+            errors.append(f"{owner}: resilience max_retry_after must not be negative")
+        if resilience.circuit_failure_threshold < 0:
+            errors.append(f"{owner}: resilience circuit_failure_threshold must not be negative")
+        if resilience.circuit_reset_timeout < 0:
+            errors.append(f"{owner}: resilience circuit_reset_timeout must not be negative")
+
+        return errors
+
+    @classmethod
+    def _validate_limits(
+        cls, owner: str, rate_limit: Optional[RateLimitConfig], max_concurrency: Optional[int]
+    ) -> List[str]:
+        """Validate rate limit and concurrency settings."""
+        errors: List[str] = []
+
+        if rate_limit:
+            if rate_limit.rate <= 0:
+                errors.append(f"{owner}: rate_limit rate must be positive")
+            if rate_limit.burst < 1:
+                errors.append(f"{owner}: rate_limit burst must be at least 1")
+        if max_concurrency is not None and max_concurrency < 1:
+            errors.append(f"{owner}: max_concurrency must be at least 1")
+
+        return errors
+
+    @classmethod
+    def _validate_tool_cache(cls, tool: Tool) -> List[str]:
+        """Validate tool response cache settings."""
+        errors: List[str] = []
+        cache = tool.cache
+
+        if tool.method.value != "GET":
+            errors.append(
+                f"Tool '{tool.name}': response caching is only supported for GET tools"
+            )
+        if cache.ttl <= 0:
+            errors.append(f"Tool '{tool.name}': cache ttl must be positive")
+        if cache.max_entries < 1:
+            errors.append(f"Tool '{tool.name}': cache max_entries must be at least 1")
+
+        param_names = {param.name for param in tool.parameters}
+        for name in cache.key_arguments or []:
+            if name not in param_names:
+                errors.append(
+                    f"Tool '{tool.name}': cache key argument '{name}' "
+                    f"is not defined in parameters"
+                )
+
+        return errors
+
+    @classmethod
+    def _validate_tool_response(cls, tool: Tool) -> List[str]:
+        """Validate tool response projection and size caps."""
+        errors: List[str] = []
+        response = tool.response
+
+        if tool.stream:
+            errors.append(
+                f"Tool '{tool.name}': streaming tools use stream_options instead of response"
+            )
+        for path in response.fields or []:
+            if not path or not all(path.split(".")):
+                errors.append(f"Tool '{tool.name}': invalid response field path '{path}'")
+        if response.fields is not None and not response.fields:
+            errors.append(f"Tool '{tool.name}': response fields must not be empty")
+        if response.max_items is not None and response.max_items < 0:
+            errors.append(f"Tool '{tool.name}': response max_items must not be negative")
+        if response.max_bytes is not None and response.max_bytes < 1:
+            errors.append(f"Tool '{tool.name}': response max_bytes must be at least 1")
+
+        return errors
+
+    @classmethod
+    def _validate_tool_pagination(cls, tool: Tool) -> List[str]:
+        """Validate tool pagination settings."""
+        errors: List[str] = []
+        pagination = tool.pagination
+
+        if tool.stream:
+            errors.append(f"Tool '{tool.name}': streaming tools cannot be paginated")
+        if tool.response and tool.response.max_bytes is not None:
+            errors.append(
+                f"Tool '{tool.name}': paginated tools cannot use response max_bytes"
+            )
+        if pagination.strategy == PaginationStrategy.CURSOR and not pagination.cursor_path:
+            errors.append(f"Tool '{tool.name}': cursor pagination requires cursor_path")
+        if pagination.page_size is not None:
+            if pagination.page_size < 1:
+                errors.append(f"Tool '{tool.name}': pagination page_size must be at least 1")
+            if not pagination.size_param:
+                errors.append(f"Tool '{tool.name}': pagination page_size requires size_param")
+        if pagination.max_pages < 1:
+            errors.append(f"Tool '{tool.name}': pagination max_pages must be at least 1")
+        if pagination.max_items < 1:
+            errors.append(f"Tool '{tool.name}': pagination max_items must be at least 1")
+
+        return errors
+
+    @classmethod
+    def _validate_tool_stream(cls, tool: Tool) -> List[str]:
+        """Validate tool streaming options."""
+        errors: List[str] = []
+        options = tool.stream_options
+
+        if tool.cache:
+            errors.append(f"Tool '{tool.name}': streaming tools cannot be cached")
+        if options.max_bytes < 1:
+            errors.append(f"Tool '{tool.name}': stream max_bytes must be at least 1")
+        if options.max_records is not None and options.max_records < 1:
+            errors.append(f"Tool '{tool.name}': stream max_records must be at least 1")
+
         return errors
 
     @classmethod
@@ -0,0 +1,88 @@
+"""Tests for multi-config generation."""
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from mcp_generator.cli.main import cli
+from mcp_generator.generator import BatchGenerator
+
+
+def write_config(path, name):
+    """Write a minimal valid configuration file."""
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "server": {
+                    "name": name,
+                    "description": f"{name} API",
+                    "base_url": "https://api.example.com",
+                },
+                "tools": [
+                    {
+                        "name": "get_user",
+                        "description": "Get user",
+                        "endpoint": "/users/{user_id}",
+                        "method": "GET",
+                        "parameters": [
+                            {"name": "user_id", "type": "string", "location": "path", "required": True}
+                        ],
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_resolve_inputs(tmp_path):
+    """Test files, directories and globs are expanded without duplicates."""
+    configs = tmp_path / "configs"
+    configs.mkdir()
+    first = write_config(configs / "a.yaml", "a")
+    second = write_config(configs / "b.json", "b")
+    (configs / "notes.txt").write_text("not a config")
+
+    assert BatchGenerator.resolve_inputs([str(configs)]) == [first, second]
+    assert BatchGenerator.resolve_inputs([str(first), str(configs / "*.json")]) == [first, second]
+
+    with pytest.raises(FileNotFoundError):
+        BatchGenerator.resolve_inputs([str(tmp_path / "missing-*.yaml")])
+
+
+def test_duplicate_stems_rejected(tmp_path):
+    """Test configs that would share an output directory are rejected."""
+    with pytest.raises(ValueError):
+        BatchGenerator([tmp_path / "a.yaml", tmp_path / "other" / "a.json"], tmp_path / "out")
+
+
+def test_run_reports_failures(tmp_path):
+    """Test a broken config fails without stopping the others."""
+    good = write_config(tmp_path / "good.yaml", "good")
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("server: {}\n")
+
+    results = BatchGenerator([bad, good], tmp_path / "out", jobs=1).run()
+
+    assert [result["ok"] for result in results] == [False, True]
+    assert any("server.name" in error for error in results[0]["errors"])
+    assert (tmp_path / "out" / "good" / "server.py").exists()
+    assert not (tmp_path / "out" / "bad").exists()
+
+
+def test_generate_cli_parallel(tmp_path):
+    """Test the CLI fans a directory out across workers and exits non-zero on failure."""
+    for name in ("one", "two", "three"):
+        write_config(tmp_path / f"{name}.yaml", name)
+    output = tmp_path / "out"
+
+    result = CliRunner().invoke(cli, ["generate", str(tmp_path), "-o", str(output), "-j", "2"])
+    assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in output.iterdir()) == ["one", "three", "two"]
+    assert (output / "two" / "server.py").exists()
+
+    (tmp_path / "zbroken.yaml").write_text("tools: []\n")
+    result = CliRunner().invoke(cli, ["generate", str(tmp_path), "-o", str(output), "-j", "2"])
+    assert result.exit_code == 1
+    assert "1 failed" in result.output
@@ -0,0 +1,84 @@
+"""Tests for the benchmark harness."""
+
+import asyncio
+
+import pytest
+
+from mcp_generator.bench import BenchmarkRunner, MockBackend
+from mcp_generator.parser import ConfigParser
+
+
+def make_config():
+    """Build a configuration with a path parameter and a body parameter."""
+    return ConfigParser.parse_dict(
+        {
+            "server": {
+                "name": "bench-api",
+                "description": "Bench API",
+                "base_url": "https://api.example.com",
+            },
+            "tools": [
+                {
+                    "name": "get_user",
+                    "description": "Get user",
+                    "endpoint": "/users/{user_id}",
+                    "method": "GET",
+                    "parameters": [
+                        {"name": "user_id", "type": "integer", "location": "path", "required": True},
+                        {"name": "fields", "type": "string", "location": "query"},
+                    ],
+                },
+                {
+                    "name": "create_post",
+                    "description": "Create post",
+                    "endpoint": "/posts",
+                    "method": "POST",
+                    "parameters": [
+                        {"name": "title", "type": "string", "location": "body", "required": True},
+                    ],
+                },
+            ],
+        }
+    )
+
+
+def test_mock_backend_routes_and_payload_size():
+    """Test the mock backend matches endpoint templates and sizes its responses."""
+    httpx = pytest.importorskip("httpx")
+    backend = MockBackend(make_config(), response_size=2048)
+
+    async def scenario():
+        base_url = await backend.start()
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            user = await client.get("/users/42?fields=id")
+            post = await client.post("/posts", json={"title": "Hello"})
+            missing = await client.get("/posts")
+        await backend.close()
+        return user, post, missing
+
+    user, post, missing = asyncio.run(scenario())
+
+    assert user.status_code == 200 and post.status_code == 200
+    assert 2048 <= len(user.content) < 2200
+    assert missing.status_code == 404
+    assert backend.requests == 3
+
+
+def test_sample_arguments():
+    """Test sample arguments cover required parameters only."""
+    config = make_config()
+    assert BenchmarkRunner.sample_arguments(config.tools[0]) == {"user_id": 1}
+    with pytest.raises(ValueError, match="Unknown tools: nope"):
+        BenchmarkRunner(config, tools=["nope"])
+
+
+def test_benchmark_runs_generated_server():
+    """Test a short benchmark drives the generated server end to end."""
+    pytest.importorskip("mcp")
+    pytest.importorskip("httpx")
+    result = BenchmarkRunner(make_config(), requests=20, concurrency=4, warmup=2).run()
+
+    assert result["requests"] == 20
+    assert result["errors"] == 0
+    assert result["backend_requests"] == 22
+    assert result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
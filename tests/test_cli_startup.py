@@ -0,0 +1,60 @@
+"""Import budget tests for CLI startup."""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "basic-api.yaml"
+
+# Loaded modules after running a CLI command in a fresh interpreter
+PROBE = """
+import json, sys
+from mcp_generator.cli.main import cli
+try:
+    cli(sys.argv[1:], prog_name="mcp-gen")
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+# Cumulative import time allowed for mcp_generator.cli, in milliseconds;
+# eager imports took around 300 ms
+IMPORT_BUDGET_MS = 120
+
+
+def loaded_modules(*args):
+    """Run a CLI command in a fresh interpreter and return the modules it loaded."""
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE, *args], capture_output=True, text=True, check=True
+    )
+    return set(json.loads(proc.stdout.splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    "args, forbidden",
+    [
+        (["--help"], ["rich", "pydantic", "yaml", "jinja2", "mcp_generator.generator.code_generator"]),
+        (["validate", str(EXAMPLE)], ["jinja2", "rich.syntax", "rich.table", "mcp_generator.bench"]),
+    ],
+)
+def test_commands_import_only_what_they_use(args, forbidden):
+    """Test heavy modules are not loaded by commands that do not need them."""
+    modules = loaded_modules(*args)
+    assert not modules & set(forbidden)
+
+
+def test_cli_import_time_budget():
+    """Test importing the CLI stays within the startup budget."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mcp_generator.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = re.search(r"\|\s+(\d+) \| mcp_generator\.cli$", proc.stderr, re.MULTILINE)
+    assert match, proc.stderr[-500:]
+    assert int(match.group(1)) / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,928 @@
+"""Tests for code generator."""
+
+import asyncio
+import importlib.util
+import json
+import shutil
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_generator.generator import CodeGenerator, code_generator, get_generator
+from mcp_generator.parser import ConfigParser
+
+
+def make_config(tool_overrides=None, **overrides):
+    """Build a small configuration exercising every parameter location."""
+    config_dict = {
+        "server": {
+            "name": "test-api",
+            "description": "Test API",
+            "base_url": "https://api.example.com",
+        },
+        "tools": [
+            {
+                "name": "get_user",
+                "description": "Get user",
+                "endpoint": "/users/{user_id}",
+                "method": "GET",
+                "parameters": [
+                    {"name": "user_id", "type": "string", "location": "path", "required": True},
+                    {"name": "fields", "type": "string", "location": "query"},
+                    {"name": "X_Trace", "type": "string", "location": "header"},
+                ],
+            },
+            {
+                "name": "create_post",
+                "description": "Create post",
+                "endpoint": "/posts",
+                "method": "POST",
+                "parameters": [
+                    {"name": "title", "type": "string", "location": "body", "required": True},
+                ],
+            },
+        ],
+    }
+    config_dict["server"].update(overrides)
+    for tool in config_dict["tools"]:
+        tool.update((tool_overrides or {}).get(tool["name"], {}))
+    return ConfigParser.parse_dict(config_dict)
+
+
+def load_server(config, tmp_path, **options):
+    """Generate a server and import it as a module."""
+    pytest.importorskip("mcp")
+    pytest.importorskip("httpx")
+    CodeGenerator().generate(config, tmp_path, **options)
+    spec = importlib.util.spec_from_file_location("generated_server", tmp_path / "server.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class RecordingClient:
+    """Stands in for MCPHTTPClient and records outgoing requests."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"ok": True}
+
+
+@pytest.fixture
+def stub_backend():
+    """Serve scripted status codes from a local HTTP server, then 200."""
+    statuses = []
+    paths = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            paths.append(self.path)
+            body = b'{"ok": true}'
+            self.send_response(statuses.pop(0) if statuses else 200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield SimpleNamespace(
+        url=f"http://127.0.0.1:{httpd.server_address[1]}", statuses=statuses, paths=paths
+    )
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_generated_server_compiles():
+    """Test generated server is valid Python."""
+    content = CodeGenerator().preview(make_config())
+    compile(content, "server.py", "exec")
+
+
+def test_dispatch_uses_handler_registry():
+    """Test call_tool dispatches through a registry instead of an if/elif chain."""
+    content = CodeGenerator().preview(make_config())
+    assert "TOOL_HANDLERS" in content
+    assert 'if name == "get_user"' not in content
+    assert "async def _handle_get_user" in content
+
+
+def test_incremental_generation(tmp_path):
+    """Test unchanged inputs skip rendering and only differing files are rewritten."""
+    generator = CodeGenerator()
+    written = generator.generate(make_config(), tmp_path)
+    assert sorted(path.name for path in written) == sorted(CodeGenerator.OUTPUT_FILES)
+    manifest = json.loads((tmp_path / CodeGenerator.MANIFEST_NAME).read_text())
+    assert set(manifest["files"]) == set(CodeGenerator.OUTPUT_FILES)
+
+    assert generator.generate(make_config(), tmp_path) == []
+
+    # A changed config only rewrites the outputs that render differently
+    written = generator.generate(make_config(timeout=5), tmp_path)
+    assert [path.name for path in written] == ["server.py"]
+
+    # A hand-edited output is restored even though the inputs are unchanged
+    (tmp_path / "README.md").write_text("edited")
+    assert [path.name for path in generator.generate(make_config(timeout=5), tmp_path)] == ["README.md"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_generator_source_is_a_manifest_input(tmp_path, monkeypatch):
+    """Test a changed generator re-renders even when the package version is unchanged."""
+    generator = CodeGenerator()
+    generator.generate(make_config(), tmp_path)
+    renders = []
+    render = generator.render
+    monkeypatch.setattr(generator, "render", lambda *args: renders.append(args) or render(*args))
+
+    generator.generate(make_config(), tmp_path)
+    assert renders == []
+
+    monkeypatch.setattr(code_generator, "generator_hash", lambda: "edited")
+    generator.generate(make_config(), tmp_path)
+    assert len(renders) == 1
+
+
+def test_stale_cleanup_stays_in_output_dir(tmp_path):
+    """Test manifest entries pointing outside the output directory are never deleted."""
+    output_dir = tmp_path / "out"
+    outside = tmp_path / "keep.txt"
+    outside.write_text("keep")
+    CodeGenerator().generate(make_config(), output_dir)
+    manifest_path = output_dir / CodeGenerator.MANIFEST_NAME
+    manifest = json.loads(manifest_path.read_text())
+    manifest["files"].update({"../keep.txt": "x", str(outside): "x", ".": "x"})
+    manifest_path.write_text(json.dumps(manifest))
+
+    CodeGenerator().generate(make_config(timeout=5), output_dir)
+
+    assert outside.read_text() == "keep"
+    assert (output_dir / "server.py").exists()
+
+
+def test_template_bytecode_cache(tmp_path, monkeypatch):
+    """Test compiled templates are stored per Jinja version and reused by new generators."""
+    monkeypatch.setenv("MCP_GEN_CACHE_DIR", str(tmp_path))
+    content = CodeGenerator().preview(make_config())
+    cache_dirs = list(tmp_path.iterdir())
+    assert len(cache_dirs) == 1 and cache_dirs[0].name.startswith("jinja-")
+    assert list(cache_dirs[0].glob("*.cache"))
+
+    assert CodeGenerator().preview(make_config()) == content
+    assert CodeGenerator(bytecode_cache=False).env.bytecode_cache is None
+
+
+def test_shared_generator():
+    """Test get_generator returns one instance per process."""
+    assert get_generator() is get_generator()
+
+
+def test_handlers_route_parameters(tmp_path):
+    """Test generated handlers route arguments to their locations."""
+    server = load_server(make_config(), tmp_path)
+    client = RecordingClient()
+    server.http_client = client
+
+    asyncio.run(server.TOOL_HANDLERS["get_user"]({"user_id": "4/2", "X_Trace": "abc"}))
+    asyncio.run(server.TOOL_HANDLERS["create_post"]({"title": "Hello"}))
+
+    assert client.calls[0]["url"] == "https://api.example.com/users/4%2F2"
+    assert client.calls[0]["query_params"] is None
+    assert client.calls[0]["headers"] == {"X_Trace": "abc"}
+    assert client.calls[1]["body"] == {"title": "Hello"}
+
+
+def test_package_layout_loads_groups_lazily(tmp_path):
+    """Test the package layout imports a tool group only on the first call into it."""
+    config = make_config({"create_post": {"tags": ["Blog Posts"]}}, batch={"enabled": True})
+    server = load_server(config, tmp_path, layout="package")
+    assert sorted(path.name for path in (tmp_path / "tools").iterdir()) == ["blog_posts.py", "users.py"]
+    assert server.TOOL_GROUPS == {"get_user": "users", "create_post": "blog_posts"}
+    assert "_handle_get_user" not in vars(server)
+
+    client = RecordingClient()
+    server.http_client = client
+    result = asyncio.run(server.call_tool("get_user", {"user_id": "4/2"}))
+    assert json.loads(result[0].text) == {"ok": True}
+    assert client.calls[0]["url"] == "https://api.example.com/users/4%2F2"
+    assert set(server.TOOL_HANDLERS) == {"get_user", "batch"}
+
+    result = asyncio.run(
+        server.call_tool("batch", {"calls": [{"tool": "create_post", "arguments": {"title": "Hi"}}]})
+    )
+    assert json.loads(result[0].text)[0]["result"] == {"ok": True}
+    assert "create_post" in server.TOOL_HANDLERS
+
+    tools = asyncio.run(server.list_tools())
+    assert [tool.name for tool in tools] == ["get_user", "create_post", "batch"]
+
+    # Switching back to a single file removes the group modules
+    CodeGenerator().generate(config, tmp_path)
+    assert not (tmp_path / "tools").exists()
+
+
+def test_stale_cleanup_tolerates_removed_directory(tmp_path):
+    """Test regenerating succeeds when stale group modules were deleted by hand."""
+    config = make_config()
+    CodeGenerator().generate(config, tmp_path, layout="package")
+    shutil.rmtree(tmp_path / "tools")
+
+    written = CodeGenerator().generate(config, tmp_path)
+
+    assert tmp_path / "server.py" in written
+    assert not (tmp_path / "tools").exists()
+
+
+def test_data_layout_matches_generated_handlers(tmp_path):
+    """Test the data layout's table-driven handlers send the same requests as generated ones."""
+    tracing = {"enabled": True, "file": str(tmp_path / "traces.jsonl"), "sample_rate": 1.0}
+    config = make_config(
+        {"get_user": {"cache": {"ttl": 60}, "output_format": "pretty"}}, tracing=tracing
+    )
+    calls = {}
+    for layout in ("single", "data"):
+        server = load_server(config, tmp_path / layout, layout=layout)
+        server.http_client = RecordingClient()
+        for name, arguments in [
+            ("get_user", {"user_id": "4/2", "fields": "login", "X_Trace": "abc"}),
+            ("get_user", {"user_id": "4/2", "fields": "login", "X_Trace": "abc"}),
+            ("get_user", {"user_id": "7"}),
+            ("create_post", {"title": "Hello"}),
+            ("create_post", {}),
+        ]:
+            result = asyncio.run(server.call_tool(name, arguments))
+        calls[layout] = server.http_client.calls
+        assert result[0].text.startswith("Error")
+        assert server.PRETTY_OUTPUT == {"get_user"}
+    assert calls["data"] == calls["single"]
+    assert len(calls["data"]) == 3
+
+    server.orjson = None
+    assert server.load_tool_table(server.TOOL_TABLE_FILE) == server.TOOL_TABLE
+    empty = tmp_path / "empty.json"
+    empty.touch()
+    with pytest.raises(RuntimeError, match="is empty"):
+        server.load_tool_table(empty)
+
+    tools = asyncio.run(server.list_tools())
+    assert [tool.name for tool in tools] == ["get_user", "create_post"]
+
+    # A schema-only change leaves the server code untouched
+    changed = make_config(
+        {"get_user": {"cache": {"ttl": 60}, "output_format": "pretty", "description": "Fetch a user"}},
+        tracing=tracing,
+    )
+    written = CodeGenerator().generate(changed, tmp_path / "data", layout="data")
+    assert "tools.json" in [path.name for path in written]
+    assert "server.py" not in [path.name for path in written]
+
+
+def test_tools_built_once(tmp_path):
+    """Test list_tools returns the tool list built at import."""
+    server = load_server(make_config(), tmp_path)
+
+    first = asyncio.run(server.list_tools())
+    assert first is server.TOOLS
+    assert asyncio.run(server.list_tools()) is first
+    assert [tool.name for tool in first] == ["get_user", "create_post"]
+
+
+def test_preserialized_tools_match_inline(tmp_path):
+    """Test pre-serialized tool definitions match the inline ones."""
+    inline = load_server(make_config(), tmp_path / "inline")
+    preserialized = load_server(make_config(preserialize_tools=True), tmp_path / "json")
+
+    assert [tool.model_dump() for tool in preserialized.TOOLS] == [
+        tool.model_dump() for tool in inline.TOOLS
+    ]
+
+
+def test_connection_pool_settings(tmp_path):
+    """Test connection pool settings reach the HTTP client and requirements."""
+    config = make_config(connection={"max_connections": 50, "http2": True})
+    CodeGenerator().generate(config, tmp_path)
+
+    assert "httpx[http2]" in (tmp_path / "requirements.txt").read_text()
+    server = (tmp_path / "server.py").read_text()
+    assert "MAX_CONNECTIONS = 50" in server
+    assert "HTTP2 = True" in server
+
+
+def test_response_cache(tmp_path):
+    """Test cached tools serve repeated calls from the cache."""
+    cache = {"ttl": 60, "max_entries": 1, "key_arguments": ["user_id"]}
+    server = load_server(make_config({"get_user": {"cache": cache}}), tmp_path)
+    client = RecordingClient()
+    server.http_client = client
+
+    async def scenario():
+        await server.TOOL_HANDLERS["get_user"]({"user_id": "1", "fields": "a"})
+        await server.TOOL_HANDLERS["get_user"]({"user_id": "1", "fields": "b"})
+        await server.TOOL_HANDLERS["get_user"]({"user_id": "2"})
+        await server.TOOL_HANDLERS["get_user"]({"user_id": "1"})
+
+    asyncio.run(scenario())
+
+    assert len(client.calls) == 3
+    assert server.cache_stats()["get_user"] == {"hits": 1, "misses": 3, "size": 1}
+    assert "create_post" not in server.CACHES
+
+
+def test_single_flight_coalesces_identical_requests(tmp_path):
+    """Test concurrent identical GET requests share one upstream request."""
+    httpx = pytest.importorskip("httpx")
+    server = load_server(make_config(single_flight=True), tmp_path)
+    seen = []
+
+    async def upstream(request):
+        seen.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"url": str(request.url)})
+
+    async def scenario():
+        client = server.MCPHTTPClient(server.BASE_URL, server.TIMEOUT)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        calls = [
+            client.request("GET", "/users/{user_id}", path_params={"user_id": "1"})
+            for _ in range(5)
+        ]
+        calls.append(
+            client.request(
+                "GET", "/users/{user_id}", path_params={"user_id": "1"}, query_params={"a": 1}
+            )
+        )
+        results = await asyncio.gather(*calls)
+        await client.close()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert len(seen) == 2
+    assert all(result == results[0] for result in results[:5])
+
+
+@pytest.mark.parametrize(
+    "stream_format, body, expected",
+    [
+        ("ndjson", b'{"a": 1}\n\n{"a": 2}\n{"a"', ['{"a": 1}', '{"a": 2}', '{"a"']),
+        ("sse", b"event: x\ndata: one\n\ndata: two\ndata: more\n\n", ["one", "two\nmore"]),
+    ],
+)
+@pytest.mark.parametrize("layout", ["single", "data"])
+def test_streaming_tool_reads_records(tmp_path, stream_format, body, expected, layout):
+    """Test streaming tools split the body into records as it arrives."""
+    httpx = pytest.importorskip("httpx")
+    stream = {"stream": True, "stream_options": {"format": stream_format}}
+    server = load_server(make_config({"get_user": stream}), tmp_path, layout=layout)
+
+    async def chunks():
+        for i in range(0, len(body), 3):
+            yield body[i : i + 3]
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+        )
+        result = await server.TOOL_HANDLERS["get_user"]({"user_id": "1"})
+        await client.close()
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result.records == expected
+    assert not result.truncated
+
+
+def test_streaming_tool_stops_at_byte_limit(tmp_path):
+    """Test streaming tools never read past max_bytes."""
+    httpx = pytest.importorskip("httpx")
+    server = load_server(make_config({"get_user": {"stream": True}}), tmp_path)
+    body = b"1234\n5678\n" * 1000
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        )
+        result = await client.stream(
+            "GET", "/users", stream_format="ndjson", max_bytes=8, max_records=None
+        )
+        await client.close()
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result.records == ["1234"]
+    assert result.truncated
+    assert result.to_content()[-1].text.startswith("[truncated")
+
+
+def test_streaming_tool_retries_and_respects_circuit(tmp_path):
+    """Test streaming calls retry transient statuses and fail fast while the circuit is open."""
+    httpx = pytest.importorskip("httpx")
+    resilience = {"max_retries": 1, "backoff_base": 0.001, "circuit_failure_threshold": 2}
+    config = make_config({"get_user": {"stream": True}}, resilience=resilience)
+    server = load_server(config, tmp_path)
+    statuses = [503, 200, 503, 503]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(statuses.pop(0), content=b"1\n2\n")
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        result = await server.TOOL_HANDLERS["get_user"]({"user_id": "1"})
+        with pytest.raises(httpx.HTTPStatusError):
+            await server.TOOL_HANDLERS["get_user"]({"user_id": "1"})
+        with pytest.raises(server.CircuitOpenError):
+            await server.TOOL_HANDLERS["get_user"]({"user_id": "1"})
+        await client.close()
+        return result
+
+    assert asyncio.run(scenario()).records == ["1", "2"]
+    assert len(requests) == 4
+
+
+def test_output_format(tmp_path):
+    """Test results are compact by default and pretty when configured per tool."""
+    httpx = pytest.importorskip("httpx")
+    config = make_config({"create_post": {"output_format": "pretty"}})
+    server = load_server(config, tmp_path)
+    payload = b'{"id": 1,  "tags": ["a"]}'
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=payload, headers={"content-type": "application/json"}
+                )
+            )
+        )
+        compact = await server.call_tool("get_user", {"user_id": "1"})
+        pretty = await server.call_tool("create_post", {"title": "Hello"})
+        await client.close()
+        return compact[0].text, pretty[0].text
+
+    compact, pretty = asyncio.run(scenario())
+
+    # JSON bodies of compact tools are passed through byte-for-byte
+    assert compact == payload.decode()
+    assert pretty == '{\n  "id": 1,\n  "tags": [\n    "a"\n  ]\n}'
+    assert server.PRETTY_OUTPUT == {"create_post"}
+
+
+def test_response_projection_and_item_cap(tmp_path):
+    """Test responses are projected to the configured fields and arrays capped."""
+    httpx = pytest.importorskip("httpx")
+    response = {"fields": ["id", "owner.login"], "max_items": 2, "truncation_marker": "[cut]"}
+    server = load_server(make_config({"get_user": {"response": response}}), tmp_path)
+    payload = [{"id": n, "name": "repo", "owner": {"login": "octo", "id": 7}} for n in range(5)]
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+        )
+        result = await server.call_tool("get_user", {"user_id": "1"})
+        await client.close()
+        return json.loads(result[0].text)
+
+    assert asyncio.run(scenario()) == [
+        {"id": 0, "owner": {"login": "octo"}},
+        {"id": 1, "owner": {"login": "octo"}},
+        "[cut] (3 more items)",
+    ]
+
+
+def test_response_byte_cap_stops_reading(tmp_path):
+    """Test oversized bodies are cut off at max_bytes without reading the rest."""
+    httpx = pytest.importorskip("httpx")
+    server = load_server(make_config({"get_user": {"response": {"max_bytes": 10}}}), tmp_path)
+    chunks_read = []
+
+    async def chunks():
+        for n in range(100):
+            chunks_read.append(n)
+            yield b'{"a": 1234},'
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+        )
+        capped = await client.request("GET", "/users", tool="get_user")
+        read = len(chunks_read)
+        uncapped = await client.request("GET", "/users", tool="create_post")
+        await client.close()
+        return capped, read, uncapped
+
+    capped, read, uncapped = asyncio.run(scenario())
+
+    assert capped == {"truncated": True, "max_bytes": 10, "partial": '{"a": 1234...[truncated]'}
+    assert read == 1
+    assert uncapped["status_code"] == 200
+
+
+def paged_backend(httpx, page_size=2, total=5):
+    """Return a mock transport serving numbered items by page, offset, cursor or Link."""
+
+    def upstream(request):
+        params = request.url.params
+        if "cursor" in params or "offset" in params:
+            start = int(params.get("cursor") or params.get("offset"))
+        else:
+            start = (int(params.get("page", 1)) - 1) * page_size
+        items = list(range(start, min(start + page_size, total)))
+        following = start + page_size if start + page_size < total else None
+        headers = {}
+        if following is not None:
+            headers["link"] = f'<https://api.example.com/users/1?cursor={following}>; rel="next"'
+        return httpx.Response(
+            200, json={"data": items, "next": following}, headers=headers
+        )
+
+    return httpx.MockTransport(upstream)
+
+
+@pytest.mark.parametrize(
+    "pagination, expected_pages",
+    [
+        ({"strategy": "page", "size_param": "per_page", "page_size": 2}, 3),
+        ({"strategy": "offset", "size_param": "per_page", "page_size": 2}, 3),
+        ({"strategy": "cursor", "cursor_path": "next"}, 3),
+        ({"strategy": "link"}, 3),
+        ({"strategy": "link", "max_pages": 2}, 2),
+        ({"strategy": "page", "max_items": 3, "prefetch": False}, 2),
+    ],
+)
+def test_pagination_aggregates_pages(tmp_path, pagination, expected_pages):
+    """Test paginated tools follow pages until exhausted or out of budget."""
+    httpx = pytest.importorskip("httpx")
+    pagination = {"items_path": "data", **pagination}
+    server = load_server(make_config({"get_user": {"pagination": pagination}}), tmp_path)
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(transport=paged_backend(httpx))
+        result = await server.call_tool("get_user", {"user_id": "1"})
+        await client.close()
+        return json.loads(result[0].text)
+
+    result = asyncio.run(scenario())
+    budget = min(pagination.get("max_items", 5), 2 * pagination.get("max_pages", 10))
+
+    assert result["items"] == list(range(budget))
+    assert result["pages"] == expected_pages
+    assert result["truncated"] == (budget < 5)
+
+
+def test_link_pagination_keeps_query_api_key(tmp_path, monkeypatch):
+    """Test follow-up pages carry a query API key the Link URL lacks."""
+    httpx = pytest.importorskip("httpx")
+    monkeypatch.setenv("API_AUTH_TOKEN", "secret")
+    config = make_config(
+        {"get_user": {"pagination": {"strategy": "link", "items_path": "data"}}},
+        authentication={"type": "apikey", "location": "query", "name": "key"},
+    )
+    server = load_server(config, tmp_path)
+    transport = paged_backend(httpx)
+    seen = []
+
+    def upstream(request):
+        seen.append(request.url.params.get("key"))
+        return transport.handle_request(request)
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        result = await server.call_tool("get_user", {"user_id": "1"})
+        await client.close()
+        return json.loads(result[0].text)
+
+    result = asyncio.run(scenario())
+
+    assert result["items"] == list(range(5))
+    assert seen == ["secret"] * 3
+
+
+def test_pagination_shapes_collected_items(tmp_path):
+    """Test response fields apply to the aggregated items, not each page envelope."""
+    httpx = pytest.importorskip("httpx")
+    pagination = {"strategy": "cursor", "items_path": "data", "cursor_path": "next"}
+    config = make_config(
+        {"get_user": {"pagination": pagination, "response": {"fields": ["id"], "max_items": 3}}}
+    )
+    server = load_server(config, tmp_path)
+
+    def upstream(request):
+        start = int(request.url.params.get("cursor", 0))
+        items = [{"id": i, "name": f"user {i}"} for i in range(start, min(start + 2, 5))]
+        following = start + 2 if start + 2 < 5 else None
+        return httpx.Response(200, json={"data": items, "next": following})
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        result = await server.call_tool("get_user", {"user_id": "1"})
+        await client.close()
+        return json.loads(result[0].text)
+
+    result = asyncio.run(scenario())
+
+    assert result["items"] == [{"id": 0}, {"id": 1}, {"id": 2}, "...[truncated] (2 more items)"]
+    assert result["pages"] == 3
+
+
+def test_metrics_registry(tmp_path):
+    """Test tool calls are counted and exposed as Prometheus text."""
+    httpx = pytest.importorskip("httpx")
+    metrics = {"enabled": True, "port": 9464, "file": str(tmp_path / "metrics.prom")}
+    server = load_server(make_config(metrics=metrics), tmp_path)
+    responses = [httpx.Response(200, json={"id": 1}), httpx.Response(500)]
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        await server.call_tool("get_user", {"user_id": "1"})
+        await server.call_tool("get_user", {"user_id": "2"})
+        await server.call_tool("missing", {})
+
+        exporter = await server.serve_metrics("127.0.0.1", 0)
+        port = exporter.sockets[0].getsockname()[1]
+        async with httpx.AsyncClient() as scraper:
+            scraped = await scraper.get(f"http://127.0.0.1:{port}/metrics")
+        exporter.close()
+        await client.close()
+        return scraped
+
+    scraped = asyncio.run(scenario())
+    server.write_metrics(metrics["file"])
+
+    text = server.METRICS.render()
+    assert scraped.status_code == 200
+    assert scraped.text == text
+    assert 'mcp_tool_calls_total{tool="get_user"} 2' in text
+    assert 'mcp_tool_errors_total{tool="get_user"} 1' in text
+    assert 'mcp_tool_errors_total{tool="unknown"} 1' in text
+    assert 'mcp_tool_in_flight{tool="get_user"} 0' in text
+    assert 'mcp_upstream_request_duration_seconds_count{tool="get_user"} 2' in text
+    assert 'mcp_upstream_request_duration_seconds_bucket{tool="get_user",le="+Inf"} 2' in text
+    assert (tmp_path / "metrics.prom").read_text() == text
+
+
+def test_metrics_disabled_emit_no_code():
+    """Test servers without metrics carry no instrumentation."""
+    content = CodeGenerator().preview(make_config())
+    assert "METRICS" not in content
+
+
+def test_tracing_writes_sampled_spans(tmp_path):
+    """Test sampled tool calls are written as JSONL traces with phase spans."""
+    httpx = pytest.importorskip("httpx")
+    trace_file = tmp_path / "traces.jsonl"
+    tracing = {"enabled": True, "file": str(trace_file), "sample_rate": 1.0}
+    server = load_server(make_config(tracing=tracing), tmp_path)
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 1}))
+        )
+        await server.call_tool("get_user", {"user_id": "1", "fields": "id"})
+        await server.call_tool("missing", {})
+        await server.TRACER.close()
+        await client.close()
+
+    asyncio.run(scenario())
+
+    ok, failed = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    assert ok["tool"] == "get_user" and not ok["error"]
+    assert [span["name"] for span in ok["spans"]] == [
+        "arguments",
+        "prepare",
+        "upstream",
+        "decode",
+        "handler",
+        "serialize",
+    ]
+    assert failed["error"]
+
+
+def test_trace_writer_survives_unwritable_records(tmp_path):
+    """Test a trace that cannot be serialized does not stop the writer or hang close."""
+    trace_file = tmp_path / "traces.jsonl"
+    tracing = {"enabled": True, "file": str(trace_file), "sample_rate": 1.0}
+    server = load_server(make_config(tracing=tracing), tmp_path)
+    circular = {}
+    circular["self"] = circular
+
+    async def scenario():
+        server.TRACER.submit(circular)
+        await asyncio.sleep(0)
+        server.TRACER.submit({"tool": "get_user"})
+        await asyncio.wait_for(server.TRACER.close(), timeout=5)
+
+    asyncio.run(scenario())
+
+    assert [json.loads(line) for line in trace_file.read_text().splitlines()] == [
+        {"tool": "get_user"}
+    ]
+
+
+def test_retries_transient_failures(tmp_path, stub_backend):
+    """Test idempotent requests are retried on retryable status codes."""
+    resilience = {"max_retries": 2, "backoff_base": 0.001, "backoff_max": 0.01}
+    config = make_config(base_url=stub_backend.url, resilience=resilience)
+    server = load_server(config, tmp_path)
+    stub_backend.statuses.extend([503, 503])
+
+    async def scenario():
+        client = server.get_http_client()
+        result = await server.call_tool("get_user", {"user_id": "1"})
+        stub_backend.statuses.append(503)
+        with pytest.raises(server.httpx.HTTPStatusError):
+            await client.request("POST", "/posts", body={"title": "x"})
+        await client.close()
+        return result
+
+    result = asyncio.run(scenario())
+
+    assert result[0].text == '{"ok": true}'
+    assert stub_backend.paths == ["/users/1"] * 3 + ["/posts"]
+
+
+def test_circuit_breaker_fails_fast(tmp_path, stub_backend):
+    """Test the circuit opens after repeated failures and stops calling the backend."""
+    resilience = {"max_retries": 0, "circuit_failure_threshold": 2, "circuit_reset_timeout": 60}
+    config = make_config(base_url=stub_backend.url, resilience=resilience)
+    server = load_server(config, tmp_path)
+    stub_backend.statuses.extend([500] * 5)
+
+    async def scenario():
+        client = server.get_http_client()
+        for _ in range(2):
+            with pytest.raises(server.httpx.HTTPStatusError):
+                await client.request("GET", "/users")
+        with pytest.raises(server.CircuitOpenError):
+            await client.request("GET", "/users")
+        await client.close()
+
+    asyncio.run(scenario())
+
+    assert len(stub_backend.paths) == 2
+
+
+def test_concurrency_and_rate_limits(tmp_path):
+    """Test per-tool concurrency caps and token bucket rate limits."""
+    httpx = pytest.importorskip("httpx")
+    config = make_config(
+        {"get_user": {"max_concurrency": 2, "rate_limit": {"rate": 50, "burst": 2}}}
+    )
+    server = load_server(config, tmp_path)
+    state = {"active": 0, "peak": 0}
+
+    async def upstream(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return httpx.Response(200, json={})
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+        calls = [server.TOOL_HANDLERS["get_user"]({"user_id": str(i)}) for i in range(8)]
+        started = asyncio.get_running_loop().time()
+        gathered = asyncio.gather(*calls)
+        await asyncio.sleep(0)
+        queued = server.limiter_stats()["get_user"]["queued"]
+        await gathered
+        elapsed = asyncio.get_running_loop().time() - started
+        await client.close()
+        return queued, elapsed
+
+    queued, elapsed = asyncio.run(scenario())
+
+    assert state["peak"] == 2
+    assert queued == 6
+    # Two burst tokens, then six more at 50/s
+    assert elapsed >= 0.1
+
+
+def test_retry_after_pauses_limiter(tmp_path):
+    """Test a Retry-After response holds back later requests."""
+    httpx = pytest.importorskip("httpx")
+    server = load_server(make_config(max_concurrency=10), tmp_path)
+    responses = [httpx.Response(429, headers={"Retry-After": "0.2"}), httpx.Response(200, json={})]
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.request("GET", "/users")
+        started = asyncio.get_running_loop().time()
+        await client.request("GET", "/users")
+        elapsed = asyncio.get_running_loop().time() - started
+        await client.close()
+        return elapsed
+
+    assert asyncio.run(scenario()) >= 0.15
+
+
+def test_long_retry_after_fails_fast(tmp_path):
+    """Test a Retry-After above the ceiling fails the call without pausing or sleeping."""
+    httpx = pytest.importorskip("httpx")
+    resilience = {"max_retries": 3, "backoff_base": 0.001, "max_retry_after": 30}
+    config = make_config(max_concurrency=10, resilience=resilience)
+    server = load_server(config, tmp_path)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429, headers={"Retry-After": "86400"})
+
+    async def scenario():
+        client = server.get_http_client()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(server.RetryAfterTooLongError, match="86400s"):
+            await client.request("GET", "/users")
+        blocked = [limiter.blocked_until for limiter in client._limiters(None)]
+        await client.close()
+        return blocked
+
+    blocked = asyncio.run(scenario())
+    assert len(requests) == 1
+    assert blocked and all(until == 0 for until in blocked)
+
+
+def test_url_expression():
+    """Test endpoints compile into string concatenations with escaped path values."""
+    expression = CodeGenerator.url_expression("/repos/{owner}/{repo}/issues")
+
+    assert expression == (
+        'BASE_PREFIX + "repos/" + quote_path(arguments["owner"]) + "/" '
+        '+ quote_path(arguments["repo"]) + "/issues"'
+    )
+    assert CodeGenerator.url_expression("/") == "BASE_PREFIX"
+
+
+def test_base_prefix_keeps_base_path(tmp_path):
+    """Test precompiled URLs resolve against the base URL like urljoin."""
+    server = load_server(make_config(base_url="https://api.example.com/v1/"), tmp_path)
+    client = RecordingClient()
+    server.http_client = client
+
+    asyncio.run(server.TOOL_HANDLERS["get_user"]({"user_id": "a b"}))
+
+    assert client.calls[0]["url"] == "https://api.example.com/v1/users/a%20b"
+
+
+def test_batch_tool_runs_calls_concurrently(tmp_path):
+    """Test the batch meta-tool returns ordered per-call results and errors."""
+    server = load_server(make_config(batch={"enabled": True, "max_concurrency": 2}), tmp_path)
+    client = RecordingClient()
+    server.http_client = client
+
+    result = asyncio.run(
+        server.call_tool(
+            "batch",
+            {
+                "calls": [
+                    {"tool": "get_user", "arguments": {"user_id": "1"}},
+                    {"tool": "missing"},
+                    {"tool": "create_post", "arguments": {}},
+                    {"tool": "create_post", "arguments": {"title": "Hi"}},
+                ]
+            },
+        )
+    )
+
+    items = json.loads(result[0].text)
+    assert [item["tool"] for item in items] == ["get_user", "missing", "create_post", "create_post"]
+    assert items[0]["result"] == {"ok": True}
+    assert items[1]["error"] == "Unknown tool: missing"
+    assert "title" in items[2]["error"]
+    assert items[3]["result"] == {"ok": True}
+    assert server.TOOLS[-1].name == "batch"
+    assert len(client.calls) == 2
@@ -0,0 +1,273 @@
+"""Tests for the OpenAPI importer."""
+
+import json
+import py_compile
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from mcp_generator.cli.main import cli
+from mcp_generator.generator import CodeGenerator
+from mcp_generator.parser import ConfigParser, OpenAPIImporter
+from mcp_generator.validator import ConfigValidator
+
+SPEC = {
+    "openapi": "3.0.3",
+    "info": {"title": "Pet Store API", "version": "2.1"},
+    "servers": [
+        {
+            "url": "https://{region}.pets.example.com/v1",
+            "variables": {"region": {"default": "eu"}},
+        }
+    ],
+    "security": [{"key": []}],
+    "components": {
+        "securitySchemes": {"key": {"type": "apiKey", "in": "header", "name": "X-Api-Key"}},
+        "parameters": {
+            "Limit": {"name": "limit", "in": "query", "schema": {"type": "integer", "default": 20}},
+            "PetId": {
+                "name": "pet-id",
+                "in": "path",
+                "required": True,
+                "schema": {"type": "string"},
+            },
+        },
+        "schemas": {
+            "NewPet": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Named"},
+                    {
+                        "type": "object",
+                        "properties": {
+                            "tags": {"type": "array", "items": {"type": "string"}},
+                            "owner": {"$ref": "#/components/schemas/Owner"},
+                        },
+                    },
+                ]
+            },
+            "Named": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string", "description": "Pet name"}},
+            },
+            "Owner": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "friend": {"$ref": "#/components/schemas/Owner"},
+                },
+            },
+        },
+    },
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "tags": ["pets"],
+                "summary": "List pets",
+                "parameters": [
+                    {"$ref": "#/components/parameters/Limit"},
+                    {"name": "X-Trace-Id", "in": "header", "schema": {"type": "string"}},
+                ],
+                "responses": {"200": {"description": "A list of pets"}},
+            },
+            "post": {
+                "operationId": "createPet",
+                "tags": ["pets"],
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {"schema": {"$ref": "#/components/schemas/NewPet"}}
+                    },
+                },
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+        "/pets/{pet-id}": {
+            "parameters": [{"$ref": "#/components/parameters/PetId"}],
+            "get": {"tags": ["pets"], "description": "Get a pet", "responses": {}},
+            "delete": {
+                "tags": ["admin"],
+                "parameters": [
+                    {"name": "session", "in": "cookie", "required": True, "schema": {}}
+                ],
+                "responses": {},
+            },
+        },
+        "/stores/{storeId}/inventory": {
+            "get": {"operationId": "list-pets", "tags": ["stores"], "responses": {}},
+        },
+    },
+}
+
+
+def test_converts_operations():
+    """Test operations become tools with resolved parameters and bodies."""
+    importer = OpenAPIImporter(SPEC)
+    config = importer.to_config()
+    tools = {tool.name: tool for tool in config.tools}
+
+    assert str(config.server.base_url) == "https://eu.pets.example.com/v1"
+    assert config.server.authentication.type == "apikey"
+    assert config.server.authentication.name == "X-Api-Key"
+    assert list(tools) == ["list_pets", "create_pet", "get_pets_pet_id", "list_pets_2"]
+
+    # Header names that are not identifiers cannot become arguments
+    assert [param.name for param in tools["list_pets"].parameters] == ["limit"]
+    assert tools["list_pets"].parameters[0].default == 20
+    assert tools["list_pets"].response_description == "A list of pets"
+
+    # allOf parts are merged into body parameters; the recursive owner stops nesting
+    body = {param.name: param for param in tools["create_pet"].parameters}
+    assert list(body) == ["name", "tags", "owner"]
+    assert body["name"].required and not body["tags"].required
+    assert body["tags"].items_type.value == "string"
+    assert set(body["owner"].properties["friend"].properties) == {"name", "friend"}
+    assert body["owner"].properties["friend"].properties["friend"].properties is None
+
+    # Path placeholders are renamed to identifiers; undeclared ones become strings
+    assert tools["get_pets_pet_id"].endpoint == "/pets/{pet_id}"
+    assert tools["list_pets_2"].parameters[0].name == "storeId"
+
+    assert any("DELETE /pets/{pet-id}" in warning for warning in importer.warnings)
+    assert ConfigValidator.validate(config) == []
+
+
+def test_resolves_each_reference_once(monkeypatch):
+    """Test references shared by many operations are looked up once."""
+    paths = {
+        f"/pets_{i}": {"get": {"parameters": [{"$ref": "#/components/parameters/Limit"}]}}
+        for i in range(50)
+    }
+    importer = OpenAPIImporter(dict(SPEC, paths=paths))
+    lookups = []
+    resolve = OpenAPIImporter._resolve
+
+    def counting_resolve(self, ref):
+        if ref not in self._refs:
+            lookups.append(ref)
+        return resolve(self, ref)
+
+    monkeypatch.setattr(OpenAPIImporter, "_resolve", counting_resolve)
+
+    assert len(list(importer.iter_tools())) == 50
+    assert lookups == ["#/components/parameters/Limit"]
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({"tags": ["pets"]}, ["list_pets", "create_pet", "get_pets_pet_id"]),
+        ({"paths": ["/stores/*"]}, ["list_pets"]),
+        ({"tags": ["admin"]}, []),
+    ],
+)
+def test_filters_operations(options, expected):
+    """Test tag and path filters select operations before conversion."""
+    importer = OpenAPIImporter(SPEC, **options)
+
+    assert [tool.name for tool in importer.iter_tools()] == expected
+
+
+@pytest.mark.parametrize("suffix", [".json", ".yaml"])
+def test_written_config_round_trips(tmp_path, suffix):
+    """Test the streamed config file parses and validates."""
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps(SPEC), encoding="utf-8")
+    output = tmp_path / f"config{suffix}"
+
+    count = OpenAPIImporter.from_file(spec_file, base_url="https://pets.test").write(output)
+    config = ConfigParser.parse_file(output)
+
+    assert count == len(config.tools) == 4
+    assert str(config.server.base_url) == "https://pets.test/"
+    assert ConfigValidator.validate(config) == []
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_import_openapi_command(tmp_path):
+    """Test the CLI imports a YAML spec and reports skipped operations."""
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(yaml.safe_dump(SPEC), encoding="utf-8")
+    output = tmp_path / "config.yaml"
+
+    result = CliRunner().invoke(
+        cli, ["import-openapi", str(spec_file), "-o", str(output), "--tag", "admin"]
+    )
+    assert result.exit_code == 1
+    assert "Skipped DELETE" in result.output
+    assert "No operations could be imported" in result.output
+
+    result = CliRunner().invoke(
+        cli, ["import-openapi", str(spec_file), "-o", str(output), "--path", "/pets*"]
+    )
+    assert result.exit_code == 0, result.output
+    assert len(ConfigParser.parse_file(output).tools) == 3
+
+
+def test_skips_self_including_schemas():
+    """Test schemas that include themselves skip their operation instead of crashing."""
+    schemas = {
+        "Loop": {"allOf": [{"$ref": "#/components/schemas/Loop"}]},
+        "Either": {"oneOf": [{"allOf": [{"$ref": "#/components/schemas/Either"}]}]},
+        "B": {"$ref": "#/components/schemas/C"},
+        "C": {"$ref": "#/components/schemas/B"},
+    }
+
+    def create(name):
+        schema = {"$ref": f"#/components/schemas/{name}"}
+        content = {"application/json": {"schema": schema}}
+        return {"post": {"operationId": f"create_{name}", "requestBody": {"content": content}}}
+
+    paths = {f"/{name.lower()}": create(name) for name in schemas}
+    paths["/pets"] = SPEC["paths"]["/pets"]
+    spec = dict(SPEC, paths=paths)
+    components = SPEC["components"]
+    spec["components"] = dict(components, schemas=dict(components["schemas"], **schemas))
+    importer = OpenAPIImporter(spec)
+
+    assert [tool.name for tool in importer.iter_tools()] == ["list_pets", "create_pet"]
+    skipped = [warning for warning in importer.warnings if warning.startswith("Skipped")]
+    assert len(skipped) == len(schemas)
+    assert all("circular reference" in warning for warning in skipped)
+
+
+def test_rejects_swagger_2():
+    """Test documents that are not OpenAPI 3 are rejected."""
+    with pytest.raises(ValueError, match="OpenAPI 3"):
+        OpenAPIImporter({"swagger": "2.0", "paths": {}})
+
+
+@pytest.mark.parametrize("layout", ["single", "package", "data"])
+def test_generated_server_compiles_with_quoted_text(tmp_path, layout):
+    """Test quotes, backslashes and newlines in spec text yield a valid server."""
+    limit = {
+        "name": "limit",
+        "in": "query",
+        "description": 'Maximum "pets" to return.\nDefaults to 20 (see C:\\docs).',
+        "schema": {"type": "integer"},
+    }
+    operation = {
+        "summary": 'Get a "pet" by id',
+        "tags": ["pets"],
+        "parameters": [limit],
+        "responses": {},
+    }
+    described = {"description": "Lists pets.\nIt's \"fast\".\n\nSecond paragraph.", "responses": {}}
+    info = {"title": "Pets", "description": 'Ends a docstring: """ and C:\\', "version": '2"b'}
+    schemes = {"key": {"type": "apiKey", "in": "header", "name": 'X-"Key'}}
+    spec = dict(
+        SPEC,
+        info=info,
+        components=dict(SPEC["components"], securitySchemes=schemes),
+        paths={'/pets/"odd"\\': {"get": operation}, "/owners": {"get": described}},
+    )
+    config = OpenAPIImporter(spec).to_config()
+
+    CodeGenerator(bytecode_cache=False).generate(config, tmp_path, layout=layout)
+    for path in [tmp_path / "server.py", *tmp_path.glob("tools/*.py")]:
+        py_compile.compile(str(path), doraise=True)
+
+    assert config.tools[1].description == 'Lists pets.\nIt\'s "fast".'
+    assert config.server.version == '2"b'
@@ -0,0 +1,62 @@
+"""Tests for trace reports."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from mcp_generator.cli.main import cli
+from mcp_generator.tracing import TraceReport
+
+
+def write_traces(path, durations):
+    """Write one trace per duration with a single upstream span."""
+    with path.open("w", encoding="utf-8") as f:
+        for n, duration in enumerate(durations):
+            record = {
+                "trace_id": f"{n:016x}",
+                "tool": "get_user" if n % 2 == 0 else "list_users",
+                "duration_ms": duration,
+                "error": n == 0,
+                "spans": [
+                    {"name": "upstream", "start_ms": 0.0, "duration_ms": duration / 2},
+                    {"name": "upstream", "start_ms": 0.0, "duration_ms": duration / 4},
+                ],
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def test_percentile_nearest_rank():
+    """Test percentiles use the nearest-rank method."""
+    values = list(range(1, 101))
+    assert TraceReport.percentile(values, 50) == 50
+    assert TraceReport.percentile(values, 99) == 99
+    assert TraceReport.percentile([7.0], 95) == 7.0
+    with pytest.raises(ValueError):
+        TraceReport.percentile([], 50)
+
+
+def test_summarize_sums_repeated_spans(tmp_path):
+    """Test spans of the same phase are summed per trace before aggregating."""
+    trace_file = tmp_path / "traces.jsonl"
+    write_traces(trace_file, [4.0, 8.0, 12.0, 16.0])
+
+    summary = TraceReport.summarize(TraceReport.read(trace_file))
+
+    assert summary["total"]["count"] == 4
+    assert summary["total"]["errors"] == 1
+    assert summary["total"]["p50"] == 8.0
+    assert summary["upstream"]["max"] == 12.0
+    assert TraceReport.summarize(TraceReport.read(trace_file, "list_users"))["total"]["count"] == 2
+
+
+def test_trace_report_command(tmp_path):
+    """Test the trace-report command prints a per-phase table."""
+    trace_file = tmp_path / "traces.jsonl"
+    write_traces(trace_file, [4.0, 8.0])
+
+    result = CliRunner().invoke(cli, ["trace-report", str(trace_file)])
+
+    assert result.exit_code == 0
+    assert "2 traces, 1 errors" in result.output
+    assert "upstream" in result.output
@@ -1,11 +1,18 @@
 """Tests for configuration validator."""
 
 from mcp_generator.models import (
+    CacheConfig,
+    ConnectionConfig,
     HttpMethod,
     MCPConfig,
+    MetricsConfig,
+    PaginationConfig,
+    PaginationStrategy,
     Parameter,
     ParameterLocation,
     ParameterType,
+    ResilienceConfig,
+    ResponseConfig,
     ServerConfig,
     Tool,
 )
@@ -117,3 +124,140 @@ def test_path_parameter_not_in_endpoint():
 
     errors = ConfigValidator.validate(config)
     assert any("marked as path but not in endpoint" in error for error in errors)
+
+
+def test_keepalive_exceeds_max_connections():
+    """Test validation fails when keep-alive pool is larger than the connection pool."""
+    config = MCPConfig(
+        server=ServerConfig(
+            name="test-api",
+            base_url="https://api.example.com",
+            connection=ConnectionConfig(max_connections=10, max_keepalive_connections=20),
+        ),
+        tools=[
+            Tool(
+                name="list_users",
+                description="List users",
+                endpoint="/users",
+                method=HttpMethod.GET,
+            )
+        ],
+    )
+
+    errors = ConfigValidator.validate(config)
+    assert any("must not exceed max_connections" in error for error in errors)
+
+
+def test_cache_on_non_idempotent_tool():
+    """Test validation fails when caching a POST tool."""
+    config = MCPConfig(
+        server=ServerConfig(
+            name="test-api",
+            base_url="https://api.example.com",
+        ),
+        tools=[
+            Tool(
+                name="create_user",
+                description="Create user",
+                endpoint="/users",
+                method=HttpMethod.POST,
+                cache=CacheConfig(key_arguments=["name"]),
+            )
+        ],
+    )
+
+    errors = ConfigValidator.validate(config)
+    assert any("only supported for GET tools" in error for error in errors)
+    assert any("cache key argument 'name'" in error for error in errors)
+
+
+def test_invalid_resilience_settings():
+    """Test validation fails with inconsistent retry settings."""
+    config = MCPConfig(
+        server=ServerConfig(
+            name="test-api",
+            base_url="https://api.example.com",
+            resilience=ResilienceConfig(backoff_base=5, backoff_max=1, retry_on_status=[999]),
+        ),
+        tools=[
+            Tool(
+                name="list_users",
+                description="List users",
+                endpoint="/users",
+                method=HttpMethod.GET,
+            )
+        ],
+    )
+
+    errors = ConfigValidator.validate(config)
+    assert any("backoff_max must not be below backoff_base" in error for error in errors)
+    assert any("invalid retry status code 999" in error for error in errors)
+
+
+def test_invalid_response_settings():
+    """Test validation fails with malformed response shaping options."""
+    config = MCPConfig(
+        server=ServerConfig(
+            name="test-api",
+            base_url="https://api.example.com",
+        ),
+        tools=[
+            Tool(
+                name="list_users",
+                description="List users",
+                endpoint="/users",
+                method=HttpMethod.GET,
+                response=ResponseConfig(fields=["id", "owner..login"], max_bytes=0),
+            )
+        ],
+    )
+
+    errors = ConfigValidator.validate(config)
+    assert any("invalid response field path 'owner..login'" in error for error in errors)
+    assert any("response max_bytes must be at least 1" in error for error in errors)
+
+
+def test_cursor_pagination_requires_cursor_path():
+    """Test validation fails for cursor pagination without a cursor path."""
+    config = MCPConfig(
+        server=ServerConfig(
+            name="test-api",
+            base_url="https://api.example.com",
+        ),
+        tools=[
+            Tool(
+                name="list_users",
+                description="List users",
+                endpoint="/users",
+                method=HttpMethod.GET,
+                pagination=PaginationConfig(strategy=PaginationStrategy.CURSOR, max_pages=0),
+            )
+        ],
+    )
+
+    errors = ConfigValidator.validate(config)
+    assert any("cursor pagination requires cursor_path" in error for error in errors)
+    assert any("pagination max_pages must be at least 1" in error for error in errors)
+
+
+def test_invalid_metrics_settings():
+    """Test validation fails with unusable metrics settings."""
+    config = MCPConfig(
+        server=ServerConfig(
+            name="test-api",
+            base_url="https://api.example.com",
+            metrics=MetricsConfig(enabled=True, port=70000, buckets=[0.5, 0.1]),
+        ),
+        tools=[
+            Tool(
+                name="list_users",
+                description="List users",
+                endpoint="/users",
+                method=HttpMethod.GET,
+            )
+        ],
+    )
+
+    errors = ConfigValidator.validate(config)
+    assert any("Metrics port 70000 is out of range" in error for error in errors)
+    assert any("buckets must be strictly increasing" in error for error in errors)
@@ -0,0 +1,29 @@
+"""Tests for watch mode."""
+
+from mcp_generator.generator import ConfigWatcher
+
+from .test_batch import write_config
+
+
+def test_watcher_rebuilds_after_debounced_change(tmp_path):
+    """Test a config change is picked up once it settles and reuses the generator."""
+    config_file = write_config(tmp_path / "api.yaml", "api")
+    watcher = ConfigWatcher(config_file, tmp_path / "out", debounce=0)
+    generator = watcher.generator
+
+    result = watcher.rebuild()
+    assert result["ok"] and len(result["written"]) == 4
+    assert watcher.poll() is None
+
+    write_config(config_file, "renamed-api")
+    assert watcher.poll() is None  # change seen, waiting for it to settle
+    result = watcher.poll()
+    assert result["ok"]
+    assert "renamed-api" in (tmp_path / "out" / "server.py").read_text()
+    assert watcher.generator is generator
+    assert watcher.poll() is None
+
+    config_file.write_text("tools: [")
+    watcher.poll()
+    result = watcher.poll()
+    assert not result["ok"] and result["errors"]